@@ -9,12 +9,18 @@ Usage:
     uv run python3 auth.py store   # interactively store credentials
     uv run python3 auth.py verify  # test credentials against iCloud
     uv run python3 auth.py clear   # remove stored credentials
+    uv run python3 auth.py help    # show this message
+
+Scripted provisioning (password read from stdin when it is not a TTY):
+    echo "$APP_PASSWORD" | uv run python3 auth.py store --apple-id you@icloud.com
 """
 
 from __future__ import annotations
 
+import argparse
 import getpass
 import sys
+import threading
 
 import keyring
 
@@ -22,27 +28,53 @@ SERVICE = "icloud-mcp"
 KEY_APPLE_ID = "apple_id"
 KEY_APP_PASSWORD = "app_specific_password"
 
+# In-process memo of the Keychain lookup — each keyring read on macOS goes
+# through the Security framework and costs several milliseconds.
+_CREDS_CACHE: tuple[str, str] | None = None
+_CREDS_LOCK = threading.Lock()
+
+_STORE_BANNER = (
+    "iCloud MCP — Store Credentials\n"
+    + "=" * 40 + "\n"
+    "Enter your Apple ID and an app-specific password.\n"
+    "Generate an app-specific password at: https://appleid.apple.com\n"
+    "(Account > Sign-In and Security > App-Specific Passwords)\n\n"
+)
+
+
+def store_credentials(apple_id: str | None = None) -> None:
+    """
+    Store credentials in the Keychain.
+
+    Prompts for anything not supplied. When stdin is not a TTY the
+    app-specific password is read from stdin instead, so provisioning can
+    be scripted.
 
-def store_credentials() -> None:
-    """Interactively prompt for and store credentials in the Keychain."""
-    print("iCloud MCP — Store Credentials")
-    print("=" * 40)
-    print("Enter your Apple ID and an app-specific password.")
-    print("Generate an app-specific password at: https://appleid.apple.com")
-    print("(Account > Sign-In and Security > App-Specific Passwords)\n")
+    Args:
+        apple_id: Apple ID email (prompted for if omitted).
+    """
+    interactive = sys.stdin.isatty()
+    if interactive:
+        sys.stdout.write(_STORE_BANNER)
 
-    apple_id = input("Apple ID (email): ").strip()
+    if apple_id is None:
+        apple_id = input("Apple ID (email): ")
+    apple_id = apple_id.strip()
     if not apple_id:
         print("Error: Apple ID cannot be empty.")
         sys.exit(1)
 
-    app_password = getpass.getpass("App-specific password: ").strip()
+    if interactive:
+        app_password = getpass.getpass("App-specific password: ").strip()
+    else:
+        app_password = sys.stdin.read().strip()
     if not app_password:
         print("Error: Password cannot be empty.")
         sys.exit(1)
 
     keyring.set_password(SERVICE, KEY_APPLE_ID, apple_id)
     keyring.set_password(SERVICE, KEY_APP_PASSWORD, app_password)
+    invalidate_credentials_cache()
 
     print(f"\nCredentials stored in macOS Keychain under service '{SERVICE}'.")
     print("Run 'uv run python3 auth.py verify' to test them.")
@@ -52,64 +84,107 @@ def get_credentials() -> tuple[str, str]:
     """
     Retrieve credentials from the Keychain.
 
+    The result is cached for the lifetime of the process; call
+    invalidate_credentials_cache() to force a fresh Keychain read.
+
     Returns:
         (apple_id, app_password)
 
     Raises:
         RuntimeError: if credentials have not been stored yet.
     """
-    apple_id = keyring.get_password(SERVICE, KEY_APPLE_ID)
-    app_password = keyring.get_password(SERVICE, KEY_APP_PASSWORD)
+    global _CREDS_CACHE
+    if _CREDS_CACHE is not None:
+        return _CREDS_CACHE
 
-    if not apple_id or not app_password:
-        raise RuntimeError(
-            "iCloud credentials not found in Keychain.\n"
-            "Run: uv run python3 auth.py store"
-        )
+    # Concurrent first callers wait here and share one Keychain read.
+    with _CREDS_LOCK:
+        if _CREDS_CACHE is not None:
+            return _CREDS_CACHE
 
-    return apple_id, app_password
+        apple_id = keyring.get_password(SERVICE, KEY_APPLE_ID)
+        app_password = keyring.get_password(SERVICE, KEY_APP_PASSWORD)
+
+        if not apple_id or not app_password:
+            raise RuntimeError(
+                "iCloud credentials not found in Keychain.\n"
+                "Run: uv run python3 auth.py store"
+            )
+
+        _CREDS_CACHE = (apple_id, app_password)
+        return _CREDS_CACHE
+
+
+def invalidate_credentials_cache() -> None:
+    """Drop the cached credentials so the next lookup re-reads the Keychain."""
+    global _CREDS_CACHE
+    with _CREDS_LOCK:
+        _CREDS_CACHE = None
 
 
 def clear_credentials() -> None:
     """Remove stored credentials from the Keychain."""
     keyring.delete_password(SERVICE, KEY_APPLE_ID)
     keyring.delete_password(SERVICE, KEY_APP_PASSWORD)
+    invalidate_credentials_cache()
     print("Credentials removed from Keychain.")
 
 
-def verify_credentials() -> bool:
-    """Test stored credentials against iCloud CalDAV and IMAP."""
-    import imaplib
+def _check_caldav(apple_id: str, app_password: str) -> tuple[bool, str]:
+    """Log in to iCloud CalDAV and count calendars."""
     import caldav
 
-    apple_id, app_password = get_credentials()
-    print(f"Testing credentials for {apple_id} ...\n")
+    from tools._dav_pool import ICLOUD_CALDAV_URL
 
-    # ── CalDAV (Calendar) ─────────────────────────────────────────────────
-    caldav_ok = False
     try:
         client = caldav.DAVClient(
-            url="https://caldav.icloud.com/",
+            url=ICLOUD_CALDAV_URL,
             username=apple_id,
             password=app_password,
         )
         principal = client.principal()
         cals = principal.calendars()
-        print(f"  CalDAV  ✓  ({len(cals)} calendar(s) found)")
-        caldav_ok = True
+        return True, f"  CalDAV  ✓  ({len(cals)} calendar(s) found)"
     except Exception as exc:  # noqa: BLE001
-        print(f"  CalDAV  ✗  {exc}")
+        return False, f"  CalDAV  ✗  {exc}"
+
+
+def _check_imap(apple_id: str, app_password: str) -> tuple[bool, str]:
+    """Log in to iCloud IMAP."""
+    import imaplib
+
+    from tools._tls import SSL_CONTEXT
+    from tools.mail import IMAP_HOST, IMAP_PORT
 
-    # ── IMAP (Mail) ───────────────────────────────────────────────────────
-    imap_ok = False
     try:
-        conn = imaplib.IMAP4_SSL("imap.mail.me.com", 993)
+        conn = imaplib.IMAP4_SSL(
+            IMAP_HOST, IMAP_PORT, ssl_context=SSL_CONTEXT, timeout=10
+        )
         conn.login(apple_id, app_password)
-        conn.logout()
-        print("  IMAP    ✓")
-        imap_ok = True
+        # A successful LOGIN is all we need to know; drop the socket instead
+        # of waiting on a LOGOUT round-trip.
+        conn.shutdown()
+        return True, "  IMAP    ✓"
     except Exception as exc:  # noqa: BLE001
-        print(f"  IMAP    ✗  {exc}")
+        return False, f"  IMAP    ✗  {exc}"
+
+
+def verify_credentials() -> bool:
+    """Test stored credentials against iCloud CalDAV and IMAP."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    apple_id, app_password = get_credentials()
+    print(f"Testing credentials for {apple_id} ...\n")
+
+    # Both checks are network-bound round-trips — run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_cal = ex.submit(_check_caldav, apple_id, app_password)
+        f_imap = ex.submit(_check_imap, apple_id, app_password)
+        caldav_ok, caldav_msg = f_cal.result()
+        imap_ok, imap_msg = f_imap.result()
+
+    print(caldav_msg)
+    print(imap_msg)
 
     print()
     if caldav_ok and imap_ok:
@@ -121,14 +196,28 @@ def verify_credentials() -> bool:
     return caldav_ok and imap_ok
 
 
-if __name__ == "__main__":
-    command = sys.argv[1] if len(sys.argv) > 1 else "help"
-
-    if command == "store":
-        store_credentials()
-    elif command == "verify":
+def _main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="auth.py",
+        description="Manage iCloud MCP credentials in the macOS Keychain.",
+    )
+    sub = parser.add_subparsers(dest="command")
+    store = sub.add_parser("store", help="store credentials")
+    store.add_argument("--apple-id", help="Apple ID email (prompted for if omitted)")
+    sub.add_parser("verify", help="test credentials against iCloud")
+    sub.add_parser("clear", help="remove stored credentials")
+    sub.add_parser("help", help="show usage")
+    args = parser.parse_args(argv)
+
+    if args.command == "store":
+        store_credentials(args.apple_id)
+    elif args.command == "verify":
         verify_credentials()
-    elif command == "clear":
+    elif args.command == "clear":
         clear_credentials()
-    else:
+    else:  # "help" or no command
         print(__doc__)
+
+
+if __name__ == "__main__":
+    _main()
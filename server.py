@@ -9,326 +9,724 @@ Exposes iCloud Calendar, Mail, and Reminders as MCP tools.
 
 Credentials are read from the macOS Keychain — never from env vars or files.
 
+Tool results are JSON; list results are NDJSON (one object per line).
+
 Run:
     uv run python3 server.py
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import imaplib
+import importlib
 import json
+import os
 import sys
-from typing import Any
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from datetime import date, datetime
+from datetime import time as dtime
+from itertools import islice
+from types import ModuleType
+from typing import Any, Callable
 
 import mcp.server.stdio
 import mcp.types as types
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from mcp.server import Server
 
-from auth import get_credentials
-from tools import calendar as cal_tools
-from tools import mail as mail_tools
-from tools import reminders as rem_tools
+try:  # optional C-accelerated encoder
+    import orjson
+except ImportError:
+    orjson = None
+
+from auth import get_credentials, invalidate_credentials_cache
 
 server = Server("icloud-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> list[types.Tool]:
-    return [
-        # ── Calendar ──────────────────────────────────────────────────────
-        types.Tool(
-            name="calendar_list_calendars",
-            description="List all iCloud calendars.",
-            inputSchema={"type": "object", "properties": {}, "required": []},
+@functools.cache
+def _tools(name: str) -> ModuleType:
+    """Import tools.<name> on first use.
+
+    caldav and EventKit are slow to import; deferring them keeps the MCP
+    handshake fast and leaves unused subsystems unloaded.
+    """
+    return importlib.import_module(f"tools.{name}")
+
+
+def _is_auth_error(exc: Exception) -> bool:
+    """Return True if *exc* means iCloud rejected the stored credentials."""
+    if "smtplib" in sys.modules:  # only loaded once mail_send_message ran
+        from smtplib import SMTPAuthenticationError
+
+        if isinstance(exc, SMTPAuthenticationError):
+            return True
+    if isinstance(exc, imaplib.IMAP4.error):
+        return "AUTHENTICATIONFAILED" in str(exc).upper()
+    if "caldav" not in sys.modules:
+        return False
+    from caldav.lib.error import AuthorizationError
+
+    return isinstance(exc, AuthorizationError)
+
+
+# Tool definitions are static — build them once at import rather than on
+# every list_tools RPC.
+_TOOLS: tuple[types.Tool, ...] = (
+    # ── Calendar ──────────────────────────────────────────────────────────
+    types.Tool(
+        name="calendar_list_calendars",
+        description="List all iCloud calendars.",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="calendar_list_events",
+        description=(
+            "List calendar events in a date range. "
+            "Defaults to the next 7 days if no dates are given."
         ),
-        types.Tool(
-            name="calendar_list_events",
-            description=(
-                "List calendar events in a date range. "
-                "Defaults to the next 7 days if no dates are given."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "from_date": {
-                        "type": "string",
-                        "description": "Start date (ISO-8601). Defaults to today.",
-                    },
-                    "to_date": {
-                        "type": "string",
-                        "description": "End date (ISO-8601). Defaults to 7 days from today.",
-                    },
-                    "calendar_uid": {
-                        "type": "string",
-                        "description": "Restrict results to this calendar UID.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date (ISO-8601). Defaults to today.",
                 },
-                "required": [],
-            },
-        ),
-        types.Tool(
-            name="calendar_get_event",
-            description="Get full details of a single calendar event by UID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_uid": {"type": "string", "description": "The event UID."}
+                "to_date": {
+                    "type": "string",
+                    "description": "End date (ISO-8601). Defaults to 7 days from today.",
                 },
-                "required": ["event_uid"],
-            },
-        ),
-        types.Tool(
-            name="calendar_create_event",
-            description="Create a new calendar event.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Event title."},
-                    "start": {"type": "string", "description": "Start datetime (ISO-8601)."},
-                    "end": {"type": "string", "description": "End datetime (ISO-8601)."},
-                    "calendar_uid": {
-                        "type": "string",
-                        "description": "Target calendar UID (uses first calendar if omitted).",
-                    },
-                    "location": {"type": "string", "description": "Optional location."},
-                    "description": {"type": "string", "description": "Optional notes."},
+                "calendar_uid": {
+                    "type": "string",
+                    "description": "Restrict results to this calendar UID.",
                 },
-                "required": ["title", "start", "end"],
             },
-        ),
-        # ── Mail ──────────────────────────────────────────────────────────
-        types.Tool(
-            name="mail_list_mailboxes",
-            description="List all iCloud Mail mailboxes / folders.",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        types.Tool(
-            name="mail_list_messages",
-            description="List messages in a mailbox (default: INBOX).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mailbox": {"type": "string", "description": "Mailbox name (default: INBOX)."},
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max messages to return (default 20, max 100).",
-                    },
-                    "unread_only": {
-                        "type": "boolean",
-                        "description": "Return only unread messages.",
-                    },
-                },
-                "required": [],
+            "required": [],
+        },
+    ),
+    types.Tool(
+        name="calendar_get_event",
+        description="Get full details of a single calendar event by UID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_uid": {"type": "string", "description": "The event UID."}
             },
-        ),
-        types.Tool(
-            name="mail_get_message",
-            description="Get the full content of an email by UID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "uid": {"type": "string", "description": "Message UID."},
-                    "mailbox": {
-                        "type": "string",
-                        "description": "Mailbox containing the message (default: INBOX).",
-                    },
+            "required": ["event_uid"],
+        },
+    ),
+    types.Tool(
+        name="calendar_create_event",
+        description="Create a new calendar event.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Event title."},
+                "start": {"type": "string", "description": "Start datetime (ISO-8601)."},
+                "end": {"type": "string", "description": "End datetime (ISO-8601)."},
+                "calendar_uid": {
+                    "type": "string",
+                    "description": "Target calendar UID (uses first calendar if omitted).",
                 },
-                "required": ["uid"],
+                "location": {"type": "string", "description": "Optional location."},
+                "description": {"type": "string", "description": "Optional notes."},
             },
-        ),
-        types.Tool(
-            name="mail_send_message",
-            description="Send an email via iCloud Mail.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to": {"type": "string", "description": "Recipient address (or comma-separated list)."},
-                    "subject": {"type": "string", "description": "Email subject."},
-                    "body": {"type": "string", "description": "Plain-text body."},
-                    "cc": {"type": "string", "description": "Optional CC addresses."},
-                    "bcc": {"type": "string", "description": "Optional BCC addresses."},
+            "required": ["title", "start", "end"],
+        },
+    ),
+    # ── Mail ──────────────────────────────────────────────────────────────
+    types.Tool(
+        name="mail_list_mailboxes",
+        description="List all iCloud Mail mailboxes / folders.",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="mail_list_messages",
+        description="List messages in a mailbox (default: INBOX).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mailbox": {"type": "string", "description": "Mailbox name (default: INBOX)."},
+                "mailboxes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "List several mailboxes at once instead of 'mailbox'; "
+                        "each message then includes its 'mailbox'."
+                    ),
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max messages to return (default 20, max 100).",
+                },
+                "unread_only": {
+                    "type": "boolean",
+                    "description": "Return only unread messages.",
                 },
-                "required": ["to", "subject", "body"],
             },
-        ),
-        # ── Reminders ─────────────────────────────────────────────────────
-        types.Tool(
-            name="reminders_list_lists",
-            description="List all iCloud Reminder lists.",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        types.Tool(
-            name="reminders_list_reminders",
-            description="List reminders, optionally filtered by list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "list_uid": {
-                        "type": "string",
-                        "description": "Restrict to a specific reminder list UID.",
-                    },
-                    "include_completed": {
-                        "type": "boolean",
-                        "description": "Include completed reminders (default: false).",
-                    },
+            "required": [],
+        },
+    ),
+    types.Tool(
+        name="mail_get_message",
+        description="Get the full content of an email by UID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "uid": {"type": "string", "description": "Message UID."},
+                "mailbox": {
+                    "type": "string",
+                    "description": "Mailbox containing the message (default: INBOX).",
                 },
-                "required": [],
             },
-        ),
-        types.Tool(
-            name="reminders_create_reminder",
-            description="Create a new reminder.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Reminder title."},
-                    "list_uid": {
-                        "type": "string",
-                        "description": "Target list UID (uses default list if omitted).",
-                    },
-                    "due": {"type": "string", "description": "Optional due date/time (ISO-8601)."},
-                    "description": {"type": "string", "description": "Optional notes."},
-                    "priority": {
-                        "type": "integer",
-                        "description": "Priority: 0=none, 1=high, 5=medium, 9=low.",
-                    },
+            "required": ["uid"],
+        },
+    ),
+    types.Tool(
+        name="mail_send_message",
+        description="Send an email via iCloud Mail.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {"type": "string", "description": "Recipient address (or comma-separated list)."},
+                "subject": {"type": "string", "description": "Email subject."},
+                "body": {"type": "string", "description": "Plain-text body."},
+                "cc": {"type": "string", "description": "Optional CC addresses."},
+                "bcc": {"type": "string", "description": "Optional BCC addresses."},
+            },
+            "required": ["to", "subject", "body"],
+        },
+    ),
+    # ── Reminders ─────────────────────────────────────────────────────────
+    types.Tool(
+        name="reminders_list_lists",
+        description="List all iCloud Reminder lists.",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="reminders_list_reminders",
+        description="List reminders, optionally filtered by list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_uid": {
+                    "type": "string",
+                    "description": "Restrict to a specific reminder list UID.",
+                },
+                "include_completed": {
+                    "type": "boolean",
+                    "description": "Include completed reminders (default: false).",
                 },
-                "required": ["title"],
             },
-        ),
-        types.Tool(
-            name="reminders_complete_reminder",
-            description="Mark a reminder as completed.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "uid": {"type": "string", "description": "The reminder UID."}
+            "required": [],
+        },
+    ),
+    types.Tool(
+        name="reminders_create_reminder",
+        description="Create a new reminder.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Reminder title."},
+                "list_uid": {
+                    "type": "string",
+                    "description": "Target list UID (uses default list if omitted).",
+                },
+                "due": {"type": "string", "description": "Optional due date/time (ISO-8601)."},
+                "description": {"type": "string", "description": "Optional notes."},
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority: 0=none, 1=high, 5=medium, 9=low.",
                 },
-                "required": ["uid"],
             },
-        ),
-    ]
+            "required": ["title"],
+        },
+    ),
+    types.Tool(
+        name="reminders_complete_reminder",
+        description="Mark a reminder as completed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "uid": {"type": "string", "description": "The reminder UID."}
+            },
+            "required": ["uid"],
+        },
+    ),
+)
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
-    try:
-        result: Any
+# The whole list_tools reply, built once. Returning a ready ListToolsResult
+# also spares the MCP runtime from wrapping the list in a new model on every
+# call.
+_LIST_TOOLS_RESULT = types.ListToolsResult(tools=list(_TOOLS))
 
-        # Credentials needed for CalDAV + IMAP tools (not Reminders)
-        if name.startswith("calendar_") or name.startswith("mail_"):
-            apple_id, app_password = get_credentials()
-
-        # ── Calendar ──────────────────────────────────────────────────────
-        if name == "calendar_list_calendars":
-            result = cal_tools.list_calendars(apple_id, app_password)
-
-        elif name == "calendar_list_events":
-            result = cal_tools.list_events(
-                apple_id,
-                app_password,
-                from_date=arguments.get("from_date"),
-                to_date=arguments.get("to_date"),
-                calendar_uid=arguments.get("calendar_uid"),
-            )
 
-        elif name == "calendar_get_event":
-            result = cal_tools.get_event(apple_id, app_password, arguments["event_uid"])
-            if result is None:
-                result = {"error": f"Event '{arguments['event_uid']}' not found."}
-
-        elif name == "calendar_create_event":
-            result = cal_tools.create_event(
-                apple_id,
-                app_password,
-                title=arguments["title"],
-                start=arguments["start"],
-                end=arguments["end"],
-                calendar_uid=arguments.get("calendar_uid"),
-                location=arguments.get("location", ""),
-                description=arguments.get("description", ""),
-            )
+@server.list_tools()
+async def list_tools() -> types.ListToolsResult:
+    return _LIST_TOOLS_RESULT
 
-        # ── Mail ──────────────────────────────────────────────────────────
-        elif name == "mail_list_mailboxes":
-            result = mail_tools.list_mailboxes(apple_id, app_password)
-
-        elif name == "mail_list_messages":
-            result = mail_tools.list_messages(
-                apple_id,
-                app_password,
-                mailbox=arguments.get("mailbox", "INBOX"),
-                limit=arguments.get("limit", 20),
-                unread_only=arguments.get("unread_only", False),
-            )
 
-        elif name == "mail_get_message":
-            result = mail_tools.get_message(
-                apple_id,
-                app_password,
-                uid=arguments["uid"],
-                mailbox=arguments.get("mailbox", "INBOX"),
-            )
-            if result is None:
-                result = {"error": f"Message '{arguments['uid']}' not found."}
-
-        elif name == "mail_send_message":
-            result = mail_tools.send_message(
-                apple_id,
-                app_password,
-                to=arguments["to"],
-                subject=arguments["subject"],
-                body=arguments["body"],
-                cc=arguments.get("cc", ""),
-                bcc=arguments.get("bcc", ""),
-            )
+# The MCP runtime's built-in input check re-validates the schema and builds
+# a fresh validator on every call; compile each tool's validator once here
+# and register call_tool with validate_input=False instead.
+_VALIDATORS = {tool.name: Draft202012Validator(tool.inputSchema) for tool in _TOOLS}
 
-        # ── Reminders (EventKit — no credentials needed) ──────────────────
-        elif name == "reminders_list_lists":
-            result = rem_tools.list_lists()
 
-        elif name == "reminders_list_reminders":
-            result = rem_tools.list_reminders(
-                list_uid=arguments.get("list_uid"),
-                include_completed=arguments.get("include_completed", False),
-            )
+def _input_error(name: str, arguments: dict[str, Any]) -> str | None:
+    """Return why *arguments* don't match the tool's schema, or None."""
+    error = best_match(_VALIDATORS[name].iter_errors(arguments))
+    return None if error is None else f"Input validation error: {error.message}"
 
-        elif name == "reminders_create_reminder":
-            result = rem_tools.create_reminder(
-                title=arguments["title"],
-                list_uid=arguments.get("list_uid"),
-                due=arguments.get("due"),
-                description=arguments.get("description", ""),
-                priority=arguments.get("priority", 0),
-            )
 
-        elif name == "reminders_complete_reminder":
-            found = rem_tools.complete_reminder(arguments["uid"])
-            result = {"completed": found}
+# ---------------------------------------------------------------------------
+# Tool handlers
+# ---------------------------------------------------------------------------
 
-        else:
+_Args = dict[str, Any]
+
+
+# ── Calendar ──────────────────────────────────────────────────────────────
+
+def _calendar_list_calendars(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    return _tools("calendar").list_calendars(apple_id, app_password)
+
+
+def _calendar_list_events(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    return _tools("calendar").list_events(
+        apple_id,
+        app_password,
+        from_date=arguments.get("from_date"),
+        to_date=arguments.get("to_date"),
+        calendar_uid=arguments.get("calendar_uid"),
+    )
+
+
+def _calendar_get_event(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    result = _tools("calendar").get_event(apple_id, app_password, arguments["event_uid"])
+    if result is None:
+        result = {"error": f"Event '{arguments['event_uid']}' not found."}
+    return result
+
+
+def _calendar_create_event(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    return _tools("calendar").create_event(
+        apple_id,
+        app_password,
+        title=arguments["title"],
+        start=arguments["start"],
+        end=arguments["end"],
+        calendar_uid=arguments.get("calendar_uid"),
+        location=arguments.get("location", ""),
+        description=arguments.get("description", ""),
+    )
+
+
+# ── Mail ──────────────────────────────────────────────────────────────────
+
+def _mail_list_mailboxes(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    return _tools("mail").list_mailboxes(apple_id, app_password)
+
+
+def _mail_list_messages(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    if arguments.get("mailboxes"):
+        return _tools("mail").list_messages_many(
+            apple_id,
+            app_password,
+            arguments["mailboxes"],
+            limit=arguments.get("limit", 20),
+            unread_only=arguments.get("unread_only", False),
+        )
+    return _tools("mail").list_messages(
+        apple_id,
+        app_password,
+        mailbox=arguments.get("mailbox", "INBOX"),
+        limit=arguments.get("limit", 20),
+        unread_only=arguments.get("unread_only", False),
+    )
+
+
+def _mail_get_message(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    result = _tools("mail").get_message(
+        apple_id,
+        app_password,
+        uid=arguments["uid"],
+        mailbox=arguments.get("mailbox", "INBOX"),
+    )
+    if result is None:
+        result = {"error": f"Message '{arguments['uid']}' not found."}
+    return result
+
+
+def _mail_send_message(apple_id: str, app_password: str, arguments: _Args) -> Any:
+    return _tools("mail").send_message(
+        apple_id,
+        app_password,
+        to=arguments["to"],
+        subject=arguments["subject"],
+        body=arguments["body"],
+        cc=arguments.get("cc", ""),
+        bcc=arguments.get("bcc", ""),
+    )
+
+
+# ── Reminders (EventKit — no credentials needed) ──────────────────────────
+
+def _reminders_list_lists(arguments: _Args) -> Any:
+    return _tools("reminders").list_lists()
+
+
+def _reminders_list_reminders(arguments: _Args) -> Any:
+    return _tools("reminders").list_reminders(
+        list_uid=arguments.get("list_uid"),
+        include_completed=arguments.get("include_completed", False),
+    )
+
+
+def _reminders_create_reminder(arguments: _Args) -> Any:
+    return _tools("reminders").create_reminder(
+        title=arguments["title"],
+        list_uid=arguments.get("list_uid"),
+        due=arguments.get("due"),
+        description=arguments.get("description", ""),
+        priority=arguments.get("priority", 0),
+    )
+
+
+def _reminders_complete_reminder(arguments: _Args) -> Any:
+    found = _tools("reminders").complete_reminder(arguments["uid"])
+    return {"completed": found}
+
+
+# Tool name → handler. Credentialed handlers take
+# (apple_id, app_password, arguments); the rest take (arguments,).
+_HANDLERS: dict[str, Callable[..., Any]] = {
+    "calendar_list_calendars": _calendar_list_calendars,
+    "calendar_list_events": _calendar_list_events,
+    "calendar_get_event": _calendar_get_event,
+    "calendar_create_event": _calendar_create_event,
+    "mail_list_mailboxes": _mail_list_mailboxes,
+    "mail_list_messages": _mail_list_messages,
+    "mail_get_message": _mail_get_message,
+    "mail_send_message": _mail_send_message,
+    "reminders_list_lists": _reminders_list_lists,
+    "reminders_list_reminders": _reminders_list_reminders,
+    "reminders_create_reminder": _reminders_create_reminder,
+    "reminders_complete_reminder": _reminders_complete_reminder,
+}
+
+# CalDAV + IMAP tools need credentials; Reminders (EventKit) does not.
+_CRED_REQUIRED = frozenset(
+    name for name in _HANDLERS if name.startswith(("calendar_", "mail_"))
+)
+
+
+# Set ICLOUD_MCP_PRETTY=1 to get indented, whole-document JSON when
+# debugging by hand; clients parse the compact form just as well.
+_PRETTY = bool(os.environ.get("ICLOUD_MCP_PRETTY"))
+
+def _default(obj: Any) -> str:
+    """Fallback encoder: ISO-8601 for dates and times, str() for the rest.
+
+    orjson encodes date/datetime natively and only gets here for other
+    types; the stdlib encoder needs it for dates as well.
+    """
+    if isinstance(obj, (date, datetime, dtime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+# json.dumps stringifies int/None dict keys; orjson rejects them unless told.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _dumps(result: Any) -> str:
+    """Serialise a tool result as compact JSON (clients parse it, not humans).
+
+    List results are emitted as NDJSON — one record per line, each encoded
+    on its own — rather than as one large array document. An empty list is
+    still sent as "[]" so the response is never blank.
+    """
+    if _PRETTY:
+        if orjson is not None:
+            opt = _ORJSON_OPTS | orjson.OPT_INDENT_2
+            return orjson.dumps(result, default=_default, option=opt).decode()
+        return json.dumps(result, indent=2, default=_default)
+    if isinstance(result, list) and result:
+        return _ndjson(result)
+    if orjson is not None:
+        return orjson.dumps(result, default=_default, option=_ORJSON_OPTS).decode()
+    return _json_dumps(result)
+
+
+def _ndjson(records: list) -> str:
+    if orjson is not None:
+        opt = _ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE
+        return b"".join(orjson.dumps(r, default=_default, option=opt) for r in records).decode()
+    return "".join(_json_dumps(r) + "\n" for r in records)
+
+
+# Long list results are split into several text parts of this many records.
+# Each part is valid NDJSON on its own and their concatenation is the full
+# result, so clients may read part by part instead of one large string.
+RESULT_PAGE_SIZE = 50
+
+
+def _pages(result: Any) -> tuple[str, ...]:
+    """Encode a tool result as one or more text parts.
+
+    Handlers may return an iterator of records instead of a list; it is
+    consumed one page at a time, so the full record list never exists.
+    """
+    if isinstance(result, Iterator):
+        if _PRETTY:
+            return (_dumps(list(result)),)
+        pages = []
+        while page := list(islice(result, RESULT_PAGE_SIZE)):
+            pages.append(_ndjson(page))
+        return tuple(pages) or (_dumps([]),)
+    if _PRETTY or not isinstance(result, list) or len(result) <= RESULT_PAGE_SIZE:
+        return (_dumps(result),)
+    return tuple(
+        _ndjson(result[i:i + RESULT_PAGE_SIZE])
+        for i in range(0, len(result), RESULT_PAGE_SIZE)
+    )
+
+
+def _content(pages: tuple[str, ...]) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=text) for text in pages]
+
+
+def _json_dumps(obj: Any) -> str:
+    """Compact stdlib encoding — no whitespace after separators."""
+    return json.dumps(obj, separators=(",", ":"), default=_default)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+# Read-only tools whose data rarely changes. Their serialised responses are
+# kept for a short TTL so repeat calls skip both the iCloud round-trip and
+# JSON encoding.
+_CACHE_TTL = 30.0
+_CACHE_MAXSIZE = 64
+_CACHEABLE = frozenset({
+    "calendar_list_calendars",
+    "mail_list_mailboxes",
+    "reminders_list_lists",
+})
+# Any of these bumps the generation, orphaning every cached entry.
+_MUTATING = frozenset({
+    "calendar_create_event",
+    "mail_send_message",
+    "reminders_create_reminder",
+    "reminders_complete_reminder",
+})
+
+_cache: OrderedDict[tuple, tuple[tuple[str, ...], float]] = OrderedDict()
+_generation = 0
+
+
+def _cache_get(key: tuple) -> tuple[str, ...] | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    pages, ts = entry
+    if time.monotonic() - ts > _CACHE_TTL:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return pages
+
+
+def _cache_put(key: tuple, pages: tuple[str, ...]) -> None:
+    _cache[key] = (pages, time.monotonic())
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Throttling
+# ---------------------------------------------------------------------------
+
+# iCloud throttles per service and bursts of requests can earn an
+# account-level cooldown. Calls that reach iCloud are paced through one
+# bucket per service; Reminders (local EventKit) and cache hits are exempt.
+# A rate of 0 or less turns limiting off.
+_RATE_PER_MIN = float(os.environ.get("ICLOUD_MCP_RATE_PER_MIN", "30"))
+_RATE_BURST = int(os.environ.get("ICLOUD_MCP_RATE_BURST", "10"))
+# Sleep for a token up to this long; beyond it, fail fast with retry_after.
+_MAX_THROTTLE_WAIT = 5.0
+
+
+class _TokenBucket:
+    """Classic token bucket refilled continuously at *rate_per_min*."""
+
+    def __init__(self, rate_per_min: float, burst: int) -> None:
+        self.rate = rate_per_min / 60.0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+
+    def reserve(self, max_wait: float) -> tuple[bool, float]:
+        """Claim a token, returning (granted, seconds to wait).
+
+        A granted token may be owed: the caller must sleep for the returned
+        delay before using it. If that delay would exceed *max_wait*,
+        nothing is claimed and the delay is returned as a retry hint.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        wait = max(0.0, (1.0 - self._tokens) / self.rate)
+        if wait > max_wait:
+            return False, wait
+        self._tokens -= 1.0
+        return True, wait
+
+
+_BUCKETS: dict[str, _TokenBucket] = (
+    {service: _TokenBucket(_RATE_PER_MIN, _RATE_BURST) for service in ("calendar", "mail")}
+    if _RATE_PER_MIN > 0
+    else {}
+)
+
+
+def _served_from_cache(name: str, creds: tuple, arguments: dict[str, Any]) -> bool:
+    """Whether a loaded tools module can answer *name* without iCloud."""
+    module = sys.modules.get(f"tools.{name.partition('_')[0]}")
+    probe = getattr(module, "cached", None)
+    if probe is None or not creds:
+        return False
+    try:
+        return bool(probe(name, creds[0], arguments))
+    except Exception:  # noqa: BLE001
+        return False
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+    global _generation
+    cache_key: tuple | None = None
+
+    try:
+        result: Any
+        fn = _HANDLERS.get(name)
+        problem = _input_error(name, arguments) if fn is not None else None
+
+        if fn is None:
             result = {"error": f"Unknown tool: {name}"}
+        elif problem is not None:
+            result = {"error": problem}
+        else:
+            creds = get_credentials() if name in _CRED_REQUIRED else ()
+
+            if name in _CACHEABLE:
+                # Canonical JSON, not a tuple of items: values may be lists
+                # or dicts, which are unhashable.
+                args_key = json.dumps(arguments, sort_keys=True, default=str)
+                cache_key = (_generation, name, creds[:1], args_key)
+                pages = _cache_get(cache_key)
+                if pages is not None:
+                    return _content(pages)
+
+            bucket = _BUCKETS.get(name.partition("_")[0])
+            if bucket is not None and not _served_from_cache(name, creds, arguments):
+                granted, wait = bucket.reserve(_MAX_THROTTLE_WAIT)
+                if not granted:
+                    return [types.TextContent(type="text", text=_dumps({
+                        "error": "Rate limit reached; iCloud throttles bursts of requests.",
+                        "retry_after": round(wait, 1),
+                    }))]
+                if wait:
+                    await asyncio.sleep(wait)
+
+            if name in _MUTATING:
+                _generation += 1
+
+            result = fn(*creds, arguments)
+
+        # Encoding sits inside the try so a result that can't be
+        # serialised surfaces as a tool error instead of a protocol fault.
+        pages = _pages(result)
 
     except Exception as exc:  # noqa: BLE001
-        result = {"error": str(exc)}
+        # Pick up a rotated app-specific password on the next call
+        if _is_auth_error(exc):
+            invalidate_credentials_cache()
+        pages = (_dumps({"error": str(exc)}),)
+        cache_key = None
 
-    return [types.TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+    if cache_key is not None:
+        _cache_put(cache_key, pages)
+    return _content(pages)
 
 
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
+# Re-fetch calendars and mailboxes a little before their 300 s TTLs expire.
+# Set ICLOUD_MCP_WARM_INTERVAL=0 to disable background refreshes.
+_WARM_INTERVAL = float(os.environ.get("ICLOUD_MCP_WARM_INTERVAL", "270"))
+
+
+def _warm_service(module: ModuleType) -> None:
+    # Runs in a worker thread: the keyring read stays off the event loop.
+    module.warm(*get_credentials())
+
+
+async def _warm_loop() -> None:
+    """Keep the calendar and mailbox caches hot while the server is up."""
+    while True:
+        # Sleep first so start-up and the MCP handshake are left alone.
+        await asyncio.sleep(_WARM_INTERVAL)
+
+        for service in ("calendar", "mail"):
+            # Only services a tool call has already loaded are refreshed;
+            # warming must never import caldav or imaplib by itself.
+            module = sys.modules.get(f"tools.{service}")
+            if module is None:
+                continue
+            # Background work must never starve interactive calls.
+            bucket = _BUCKETS.get(service)
+            if bucket is not None and not bucket.reserve(0.0)[0]:
+                continue
+            try:
+                await asyncio.to_thread(_warm_service, module)
+            except Exception as exc:  # noqa: BLE001
+                # RuntimeError: not set up yet — try again next round.
+                if _is_auth_error(exc):
+                    invalidate_credentials_cache()
+
+
 async def _run() -> None:
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+        warmer = asyncio.create_task(_warm_loop()) if _WARM_INTERVAL > 0 else None
+        try:
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+        finally:
+            if warmer is not None:
+                warmer.cancel()
 
 
 def main() -> None:
-    import asyncio
+    try:  # optional libuv-based event loop — faster stdio dispatch
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         asyncio.run(_run())
     except KeyboardInterrupt:
@@ -0,0 +1,108 @@
+"""Process-wide CalDAV client cache.
+
+A fresh caldav.DAVClient per tool call means a fresh HTTP session and a new
+TLS handshake with caldav.icloud.com every time. Keeping one client per
+Apple ID lets PROPFIND/REPORT requests ride the session's keep-alive
+connections instead.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import caldav
+
+ICLOUD_CALDAV_URL = "https://caldav.icloud.com/"
+
+# iCloud redirects caldav.icloud.com to a per-account pNN-caldav host, so a
+# few host pools are needed; each keeps up to POOL_MAXSIZE live sockets.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+# Retry connection-level failures (resets, dropped keep-alives) only.
+MAX_RETRIES = 2
+
+try:  # caldav >= 2.0 talks HTTP through niquests
+    import niquests
+
+    class _PooledSession(niquests.Session):
+        """niquests Session with our pool sizing passed to its constructor.
+
+        Going through the constructor keeps every other setting of the
+        default adapters (QUIC cache, keep-alive, resolver) intact.
+        """
+
+        def __init__(self, **kwargs: Any) -> None:
+            kwargs.setdefault("pool_connections", POOL_CONNECTIONS)
+            kwargs.setdefault("pool_maxsize", POOL_MAXSIZE)
+            kwargs.setdefault("retries", MAX_RETRIES)
+            super().__init__(**kwargs)
+
+except ImportError:  # older caldav uses requests
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    class _PooledSession(requests.Session):  # type: ignore[no-redef]
+        """requests Session whose https adapter carries our pool sizing.
+
+        requests' default adapter has no settings beyond these, so
+        mounting a fresh one loses nothing.
+        """
+
+        def __init__(self, multiplexed: bool = False) -> None:
+            super().__init__()
+            self.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=MAX_RETRIES,
+                ),
+            )
+
+
+class _PooledDAVClient(caldav.DAVClient):
+    """DAVClient that keeps its HTTP session pooled.
+
+    caldav builds its own session and may replace it later (its HTTP
+    multiplexing fallback does), so any session assigned to the client is
+    swapped for a _PooledSession with the same multiplexing mode.
+    """
+
+    @property
+    def session(self) -> Any:
+        return self._session
+
+    @session.setter
+    def session(self, session: Any) -> None:
+        if not isinstance(session, _PooledSession):
+            multiplexed = bool(getattr(session, "multiplexed", False))
+            session.close()
+            session = _PooledSession(multiplexed=multiplexed)
+        self._session = session
+
+_CLIENTS: dict[str, tuple[str, caldav.DAVClient]] = {}
+_LOCK = threading.Lock()
+
+
+def get_client(apple_id: str, app_password: str) -> caldav.DAVClient:
+    """Return the cached CalDAV client for *apple_id*, creating it on first use."""
+    with _LOCK:
+        entry = _CLIENTS.get(apple_id)
+        if entry is not None and entry[0] == app_password:
+            return entry[1]
+
+        client = _PooledDAVClient(
+            url=ICLOUD_CALDAV_URL,
+            username=apple_id,
+            password=app_password,
+            ssl_verify_cert=True,
+        )
+        _CLIENTS[apple_id] = (app_password, client)
+        return client
+
+
+def evict(apple_id: str) -> None:
+    """Forget the cached client for *apple_id* (e.g. after a 401)."""
+    with _LOCK:
+        _CLIENTS.pop(apple_id, None)
@@ -0,0 +1,63 @@
+"""Minimal parser for imaplib FETCH responses.
+
+imaplib hands back FETCH data half-parsed: plain lines as bytes, and any
+server literal ({n}) as a (prefix, literal) tuple followed by the rest of
+the line. This module turns that back into nested lists so structured
+items such as ENVELOPE and BODYSTRUCTURE can be read by position.
+
+Values come back as bytes (atoms, quoted strings and literals alike),
+None for NIL, and lists for parenthesised groups.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterator
+
+_TOKEN_RE = re.compile(
+    rb'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|\{(\d+)\}\s*$|([^\s()"]+))'
+)
+_UNESCAPE_RE = re.compile(rb"\\(.)")
+
+
+def _feed(segment: bytes, stack: list[list]) -> None:
+    """Tokenise *segment* onto the list currently open at the top of *stack*."""
+    pos = 0
+    while True:
+        m = _TOKEN_RE.match(segment, pos)
+        if m is None:
+            return
+        pos = m.end()
+        opened, closed, quoted, literal, atom = m.groups()
+        if opened:
+            group: list = []
+            stack[-1].append(group)
+            stack.append(group)
+        elif closed:
+            if len(stack) > 1:
+                stack.pop()
+        elif quoted is not None:
+            stack[-1].append(_UNESCAPE_RE.sub(rb"\1", quoted))
+        elif literal is not None:
+            pass  # the literal's bytes arrive as the next tuple element
+        elif atom.upper() == b"NIL":
+            stack[-1].append(None)
+        else:
+            stack[-1].append(atom)
+
+
+def parse_fetch(data: list[Any]) -> Iterator[tuple[int, dict[bytes, Any]]]:
+    """Yield (message number, {ITEM NAME: value}) for each FETCH response."""
+    root: list = []
+    stack = [root]
+    for item in data or []:
+        if isinstance(item, tuple):
+            _feed(item[0], stack)
+            stack[-1].append(item[1])
+        elif item:
+            _feed(item, stack)
+
+    for num, items in zip(root[::2], root[1::2]):
+        if isinstance(num, bytes) and num.isdigit() and isinstance(items, list):
+            names = (n.upper() if isinstance(n, bytes) else n for n in items[::2])
+            yield int(num), dict(zip(names, items[1::2]))
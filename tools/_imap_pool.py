@@ -0,0 +1,212 @@
+"""Process-wide IMAP connection pool.
+
+Opening an IMAP4_SSL connection to iCloud costs a TCP + TLS handshake plus
+LOGIN — roughly 400 ms per tool call. The pool keeps authenticated
+connections alive between calls and health-checks each with a NOOP before
+handing it out again. Several may be parked per account so that concurrent
+callers (e.g. the background warmer) don't force fresh logins.
+"""
+
+from __future__ import annotations
+
+import imaplib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from tools._tls import SSL_CONTEXT
+
+# iCloud drops idle IMAP sessions after ~30 minutes; close ours first.
+IDLE_TIMEOUT = 25 * 60
+# Recycle even busy sessions after an hour so none lives indefinitely.
+MAX_AGE = 60 * 60
+# Idle connections kept per account; extras are logged out on release.
+MAX_IDLE = 4
+_REAP_INTERVAL = 60
+# Per-socket-operation limit, so a half-open connection (after sleep or a
+# network change) fails the NOOP check instead of hanging the server.
+SOCKET_TIMEOUT = 30
+
+# Errors that mean the connection itself is unusable.
+_DEAD = (imaplib.IMAP4.abort, OSError)
+
+
+class PipelinedIMAP(imaplib.IMAP4_SSL):
+    """IMAP4_SSL that can open a mailbox and query it in one round-trip."""
+
+    def login(self, user: str, password: str) -> tuple[str, list]:
+        """LOGIN, then record the capabilities the server now advertises.
+
+        imaplib fills ``capabilities`` from the pre-authentication
+        greeting, which usually omits extensions such as SORT. Servers
+        normally repeat the full list in the LOGIN reply; only if they
+        don't is an explicit CAPABILITY sent. Either way it happens once
+        per connection, and pooled connections keep the result.
+        """
+        typ, dat = super().login(user, password)
+        caps = self.untagged_responses.pop("CAPABILITY", None)
+        if caps:
+            text = caps[-1]
+        elif dat and dat[-1].upper().startswith(b"[CAPABILITY "):
+            text = dat[-1][12:].partition(b"]")[0]
+        else:
+            text = self.capability()[1][-1]
+        self.capabilities = frozenset(text.decode("ascii").upper().split())
+        return typ, dat
+
+    def has_capability(self, cap: str) -> bool:
+        """Whether the server advertised *cap* (e.g. "SORT") after LOGIN."""
+        return cap.upper() in self.capabilities
+
+    def examine_and(self, mailbox: str, name: str, *args: str) -> tuple[str, list]:
+        """EXAMINE *mailbox*, then run *name* in it without waiting between.
+
+        imaplib normally waits for each tagged reply before sending the
+        next command. Here both commands are written back to back and the
+        replies read afterwards, so the pair costs one round-trip instead
+        of two. Returns the follow-up's (typ, data) like imaplib's own
+        methods; raises IMAP4.error if the mailbox can't be opened.
+        """
+        self.untagged_responses = {}
+        self.is_readonly = True
+        # Pass imaplib's client-side state check for the follow-up; the
+        # server processes the commands in order, so EXAMINE lands first.
+        self.state = "SELECTED"
+        examine_tag = self._command("EXAMINE", mailbox)
+        follow_tag = self._command(name, *args)
+
+        typ, dat = self._command_complete("EXAMINE", examine_tag)
+        if typ != "OK":
+            self.state = "AUTH"
+            try:  # drain the follow-up's (necessarily failed) reply
+                self._command_complete(name, follow_tag)
+            except self.error:
+                pass
+            raise self.error(f"EXAMINE {mailbox} failed: {dat}")
+
+        typ, dat = self._command_complete(name, follow_tag)
+        if name == "UID":
+            sub = args[0].upper()
+            resp = sub if sub in ("SEARCH", "SORT", "THREAD") else "FETCH"
+        else:
+            resp = name
+        return self._untagged_response(typ, dat, resp)
+
+
+class ImapPool:
+    """Pool of authenticated IMAP connections keyed by (host, user)."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        # (host, user) → parked (connection, created at, parked at), most
+        # recently parked last so the warmest connection is reused first.
+        self._idle: dict[tuple[str, str], list[tuple[PipelinedIMAP, float, float]]] = {}
+        self._created: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+
+    def acquire(self, apple_id: str, app_password: str) -> PipelinedIMAP:
+        """Return a live connection, reusing a pooled one when possible."""
+        while True:
+            with self._lock:
+                parked = self._idle.get((self.host, apple_id))
+                entry = parked.pop() if parked else None
+                self._start_reaper()
+            if entry is None:
+                break
+
+            conn, created, parked_at = entry
+            now = time.monotonic()
+            if now - created > MAX_AGE or now - parked_at > IDLE_TIMEOUT:
+                self._discard(conn)
+                continue
+            try:
+                conn.noop()
+                return conn
+            except (imaplib.IMAP4.error, *_DEAD):
+                self._discard(conn)
+
+        conn = PipelinedIMAP(
+            self.host, self.port, ssl_context=SSL_CONTEXT, timeout=SOCKET_TIMEOUT
+        )
+        try:
+            conn.login(apple_id, app_password)
+        except BaseException:
+            conn.shutdown()
+            raise
+        with self._lock:
+            self._created[id(conn)] = time.monotonic()
+        return conn
+
+    def release(self, apple_id: str, conn: PipelinedIMAP) -> None:
+        """Return *conn* to the pool, closing it if the pool is full.
+
+        The selected mailbox is left as is: every borrower SELECTs or
+        EXAMINEs before touching messages, which resets it anyway, so an
+        extra CLOSE round-trip here would buy nothing.
+        """
+        with self._lock:
+            parked = self._idle.setdefault((self.host, apple_id), [])
+            created = self._created.get(id(conn))
+            if created is not None and len(parked) < MAX_IDLE:
+                parked.append((conn, created, time.monotonic()))
+                return
+        self._discard(conn)
+
+    def _discard(self, conn: PipelinedIMAP) -> None:
+        with self._lock:
+            self._created.pop(id(conn), None)
+        _close(conn)
+
+    @contextmanager
+    def connection(
+        self, apple_id: str, app_password: str
+    ) -> Iterator[PipelinedIMAP]:
+        """Context manager around acquire()/release()."""
+        conn = self.acquire(apple_id, app_password)
+        try:
+            yield conn
+        except _DEAD:
+            self._discard(conn)
+            raise
+        except BaseException:
+            self.release(apple_id, conn)
+            raise
+        else:
+            self.release(apple_id, conn)
+
+    def _start_reaper(self) -> None:
+        # Called with self._lock held.
+        if self._reaper is None:
+            self._reaper = threading.Thread(
+                target=self._reap_forever, name="imap-pool-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_forever(self) -> None:
+        while True:
+            time.sleep(_REAP_INTERVAL)
+            now = time.monotonic()
+            stale = []
+            with self._lock:
+                for parked in self._idle.values():
+                    keep = []
+                    for entry in parked:
+                        conn, created, parked_at = entry
+                        if now - parked_at > IDLE_TIMEOUT or now - created > MAX_AGE:
+                            stale.append(conn)
+                        else:
+                            keep.append(entry)
+                    parked[:] = keep
+            for conn in stale:
+                self._discard(conn)
+
+
+def _close(conn: imaplib.IMAP4_SSL) -> None:
+    """Log out of *conn*, ignoring errors from an already-dead socket."""
+    try:
+        conn.logout()
+    except Exception:  # noqa: BLE001
+        pass
@@ -0,0 +1,12 @@
+"""Shared TLS configuration for iCloud connections.
+
+ssl.create_default_context() loads and parses the system CA bundle every
+time it is called, and imaplib/smtplib build a fresh context for every
+connection unless one is passed in. This module builds it once per process.
+"""
+
+from __future__ import annotations
+
+import ssl
+
+SSL_CONTEXT = ssl.create_default_context()
@@ -6,25 +6,138 @@ No pyicloud dependency.
 
 from __future__ import annotations
 
+import functools
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from datetime import time as dtime
+from typing import Any, Callable, Iterator, TypeVar
 
 import caldav
+from caldav.lib.error import AuthorizationError, NotFoundError
 from dateutil import parser as dateparser
 from icalendar import Calendar as iCalendar
 from icalendar import Event as iCalEvent
 
-ICLOUD_CALDAV_URL = "https://caldav.icloud.com/"
+from tools import _dav_pool
+
+_T = TypeVar("_T")
+
+# Calendar collections change rarely; re-list them at most every 5 minutes.
+# The principal URL never changes, so it is kept for the process lifetime.
+CAL_TTL = 300.0
+
+_PRINCIPAL_CACHE: dict[str, tuple[caldav.DAVClient, caldav.Principal]] = {}
+# apple_id → (calendars, calendars by id, listed at)
+_CALS_CACHE: dict[
+    str, tuple[list[caldav.Calendar], dict[str, caldav.Calendar], float]
+] = {}
+# Serialises discovery so concurrent callers share one PROPFIND.
+_DISCOVERY_LOCK = threading.RLock()
+
+# Range-aware event cache: (calendar id, window start, window end) → the
+# events found in that day-aligned UTC window. list_events answers from the
+# fresh windows and only searches iCloud for the parts of the range that no
+# window covers.
+EVENT_TTL = 60.0
+
+_Span = tuple[datetime, datetime, dict]
+_EVENT_CACHE: dict[tuple[str, datetime, datetime], tuple[list[_Span], float]] = {}
+_EVENT_LOCK = threading.Lock()
+
+# UID → (calendar id, instance start, seen at), filled by list_events and
+# create_event so get_event can go straight to the right calendar and a
+# narrow window.
+UID_TTL = 600.0
+_UID_INDEX: dict[str, tuple[str, datetime, float]] = {}
+
+# Per-calendar REPORTs are independent round-trips, so they are fanned out.
+# Never run more searches at once than the shared session has sockets.
+SEARCH_WORKERS = min(8, _dav_pool.POOL_MAXSIZE)
+_EXECUTOR = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="caldav")
+
+# Failures that must reach the caller (and _retry_on_auth) rather than count
+# as "not in this calendar": a rejected password, or the connection itself
+# failing — niquests' exceptions subclass OSError.
+_FATAL = (AuthorizationError, OSError)
 
 
 def _client(apple_id: str, app_password: str) -> caldav.DAVClient:
-    """Return an authenticated CalDAV client."""
-    return caldav.DAVClient(
-        url=ICLOUD_CALDAV_URL,
-        username=apple_id,
-        password=app_password,
-    )
+    """Return the shared, authenticated CalDAV client for this account."""
+    return _dav_pool.get_client(apple_id, app_password)
+
+
+def _get_principal(apple_id: str, app_password: str) -> caldav.Principal:
+    """Return the account's principal, discovering it once per client."""
+    client = _client(apple_id, app_password)
+    entry = _PRINCIPAL_CACHE.get(apple_id)
+    if entry is not None and entry[0] is client:
+        return entry[1]
+
+    with _DISCOVERY_LOCK:
+        entry = _PRINCIPAL_CACHE.get(apple_id)
+        if entry is not None and entry[0] is client:
+            return entry[1]
+
+        principal = client.principal()
+        _PRINCIPAL_CACHE[apple_id] = (client, principal)
+        _CALS_CACHE.pop(apple_id, None)
+        return principal
+
+
+def _calendars_entry(
+    apple_id: str, app_password: str
+) -> tuple[list[caldav.Calendar], dict[str, caldav.Calendar], float]:
+    """Return the cached calendar listing, re-listed at most every CAL_TTL seconds."""
+    principal = _get_principal(apple_id, app_password)
+    entry = _CALS_CACHE.get(apple_id)
+    if entry is not None and time.monotonic() - entry[2] < CAL_TTL:
+        return entry
+
+    with _DISCOVERY_LOCK:
+        entry = _CALS_CACHE.get(apple_id)
+        if entry is not None and time.monotonic() - entry[2] < CAL_TTL:
+            return entry
+
+        calendars = principal.calendars()
+        entry = (calendars, {str(c.id): c for c in calendars}, time.monotonic())
+        _CALS_CACHE[apple_id] = entry
+        return entry
+
+
+def _get_calendars(apple_id: str, app_password: str) -> list[caldav.Calendar]:
+    """Return the account's calendars."""
+    return _calendars_entry(apple_id, app_password)[0]
+
+
+def _get_calendar(
+    apple_id: str, app_password: str, calendar_uid: str
+) -> caldav.Calendar | None:
+    """Return the calendar whose id is *calendar_uid*, or None."""
+    return _calendars_entry(apple_id, app_password)[1].get(calendar_uid)
+
+
+def _forget(apple_id: str) -> None:
+    """Drop every cached CalDAV object for *apple_id*."""
+    with _DISCOVERY_LOCK:
+        _dav_pool.evict(apple_id)
+        _PRINCIPAL_CACHE.pop(apple_id, None)
+        _CALS_CACHE.pop(apple_id, None)
+
+
+def _retry_on_auth(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """Retry *fn* once with a fresh client if the cached one gets a 401."""
+    @functools.wraps(fn)
+    def wrapper(apple_id: str, app_password: str, *args: Any, **kwargs: Any) -> _T:
+        try:
+            return fn(apple_id, app_password, *args, **kwargs)
+        except AuthorizationError:
+            _forget(apple_id)
+            return fn(apple_id, app_password, *args, **kwargs)
+
+    return wrapper
 
 
 def _fmt_calendar(cal: caldav.Calendar) -> dict:
@@ -35,42 +148,173 @@ def _fmt_calendar(cal: caldav.Calendar) -> dict:
     }
 
 
-def _fmt_event(vevent: Any) -> dict:
-    """Extract a plain dict from a vobject/icalendar VEVENT component."""
-    def _str(val: Any) -> str:
-        if val is None:
-            return ""
-        if hasattr(val, "dt"):
-            return val.dt.isoformat() if val.dt else ""
-        return str(val)
+def _text(val: Any) -> str:
+    return "" if val is None else str(val)
+
+
+def _when(val: Any) -> date | datetime | str:
+    # DTSTART/DTEND are always vDDDTypes, so .dt needs no hasattr() probe.
+    # The native value is kept; the server's JSON encoder writes ISO-8601.
+    return val.dt if val is not None and val.dt else ""
 
+
+def _fmt_event(vevent: Any) -> dict:
+    """Extract a plain dict from an icalendar VEVENT component."""
+    get = vevent.get
     return {
-        "uid": _str(vevent.get("uid")),
-        "title": _str(vevent.get("summary")),
-        "start": _str(vevent.get("dtstart")),
-        "end": _str(vevent.get("dtend")),
-        "location": _str(vevent.get("location")),
-        "description": _str(vevent.get("description")),
+        "uid": _text(get("uid")),
+        "title": _text(get("summary")),
+        "start": _when(get("dtstart")),
+        "end": _when(get("dtend")),
+        "location": _text(get("location")),
+        "description": _text(get("description")),
     }
 
 
+@_retry_on_auth
 def list_calendars(apple_id: str, app_password: str) -> list[dict]:
     """Return all calendars for the account."""
-    client = _client(apple_id, app_password)
-    principal = client.principal()
-    return [_fmt_calendar(c) for c in principal.calendars()]
+    return [_fmt_calendar(c) for c in _get_calendars(apple_id, app_password)]
 
 
+def _utc(value: date | datetime) -> datetime:
+    """Normalise a date/datetime to an aware UTC datetime.
+
+    Naive values (floating times, bare dates) are read as local time, the
+    same way caldav converts them when building a time-range query.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, dtime.min)
+    return value.astimezone(timezone.utc)
+
+
+def _day_floor(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _day_ceil(dt: datetime) -> datetime:
+    floor = _day_floor(dt)
+    return floor if floor == dt else floor + timedelta(days=1)
+
+
+def _overlaps(ev_start: datetime, ev_end: datetime, lo: datetime, hi: datetime) -> bool:
+    """CalDAV time-range semantics: [start, end) overlap, instants inclusive."""
+    if ev_start == ev_end:
+        return lo <= ev_start < hi
+    return ev_start < hi and ev_end > lo
+
+
+def _event_span(component: Any) -> tuple[datetime, datetime]:
+    start = _utc(component.decoded("dtstart"))
+    if "dtend" in component:
+        return start, _utc(component.decoded("dtend"))
+    if "duration" in component:
+        return start, start + component.decoded("duration")
+    return start, start
+
+
+def _vevents(ev: caldav.CalendarObjectResource) -> list[Any]:
+    """Return the VEVENTs of a fetched calendar object.
+
+    Uses caldav's parsed icalendar instance — after client-side expansion
+    it is already populated, whereas ev.data would re-serialise it only for
+    us to parse it again. VEVENTs are always top-level, so the recursive
+    walk() into VALARMs and VTIMEZONE rules is skipped.
+    """
+    cal_data = ev.icalendar_instance
+    if cal_data is None:
+        return []
+    return [c for c in cal_data.subcomponents if c.name == "VEVENT"]
+
+
+def _search_window(cal: caldav.Calendar, lo: datetime, hi: datetime) -> list[_Span]:
+    """Fetch and format every event instance overlapping [lo, hi)."""
+    found: list[_Span] = []
+    for ev in cal.search(start=lo, end=hi, event=True, expand=True):
+        for component in _vevents(ev):
+            d = _fmt_event(component)
+            d["calendar"] = cal.name or ""
+            found.append((*_event_span(component), d))
+    return found
+
+
+def _gaps(
+    windows: list[tuple[datetime, datetime, Any]], lo: datetime, hi: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Return the parts of [lo, hi) that the sorted *windows* don't cover."""
+    gaps: list[tuple[datetime, datetime]] = []
+    cursor = lo
+    for w_lo, w_hi, _ in windows:
+        if w_hi <= cursor:
+            continue
+        if w_lo >= hi:
+            break
+        if w_lo > cursor:
+            gaps.append((cursor, w_lo))
+        cursor = w_hi
+    if cursor < hi:
+        gaps.append((cursor, hi))
+    return gaps
+
+
+def _cached_events(cal: caldav.Calendar, lo: datetime, hi: datetime) -> list[_Span]:
+    """Return cached events of *cal* covering [lo, hi), searching only gaps."""
+    cal_id = str(cal.id)
+    now = time.monotonic()
+
+    with _EVENT_LOCK:
+        for key in [k for k, (_, ts) in _EVENT_CACHE.items() if now - ts >= EVENT_TTL]:
+            del _EVENT_CACHE[key]
+        for uid in [u for u, (_, _, ts) in _UID_INDEX.items() if now - ts >= UID_TTL]:
+            del _UID_INDEX[uid]
+        windows = sorted(
+            (k[1], k[2], entry[0]) for k, entry in _EVENT_CACHE.items() if k[0] == cal_id
+        )
+
+    spans = [span for w_lo, w_hi, found in windows if w_lo < hi and w_hi > lo for span in found]
+    for g_lo, g_hi in _gaps(windows, lo, hi):
+        found = _search_window(cal, g_lo, g_hi)
+        with _EVENT_LOCK:
+            ts = time.monotonic()
+            _EVENT_CACHE[(cal_id, g_lo, g_hi)] = (found, ts)
+            for ev_start, _, d in found:
+                _UID_INDEX[d["uid"]] = (cal_id, ev_start, ts)
+        spans.extend(found)
+    return spans
+
+
+def _invalidate_events(cal: caldav.Calendar) -> None:
+    """Drop every cached event window of *cal*."""
+    cal_id = str(cal.id)
+    with _EVENT_LOCK:
+        for key in [k for k in _EVENT_CACHE if k[0] == cal_id]:
+            del _EVENT_CACHE[key]
+
+
+def _event_range(from_date: str | None, to_date: str | None) -> tuple[datetime, datetime]:
+    """Resolve list_events' date arguments to a UTC [start, end) range."""
+    now = datetime.now(tz=timezone.utc)
+    start = _utc(dateparser.parse(from_date)) if from_date else now
+    end = _utc(dateparser.parse(to_date)) if to_date else now + timedelta(days=7)
+    return start, end
+
+
+@_retry_on_auth
 def list_events(
     apple_id: str,
     app_password: str,
     from_date: str | None = None,
     to_date: str | None = None,
     calendar_uid: str | None = None,
-) -> list[dict]:
+) -> Iterator[dict]:
     """
     Return events in the given date range.
 
+    Results are served from a short-lived, range-aware cache; only the
+    parts of the range not fetched in the last EVENT_TTL seconds hit iCloud.
+    All fetching happens before this returns; the events themselves are
+    yielded lazily so the caller can encode them without an extra copy.
+
     Args:
         apple_id: iCloud Apple ID.
         app_password: App-specific password.
@@ -78,61 +322,144 @@ def list_events(
         to_date: ISO-8601 end date (default: 7 days from today).
         calendar_uid: Restrict to a specific calendar by UID.
     """
-    now = datetime.now(tz=timezone.utc)
-    start = dateparser.parse(from_date) if from_date else now
-    end = dateparser.parse(to_date) if to_date else now + timedelta(days=7)
-
-    client = _client(apple_id, app_password)
-    principal = client.principal()
-    calendars = principal.calendars()
+    start, end = _event_range(from_date, to_date)
 
     if calendar_uid:
-        calendars = [c for c in calendars if str(c.id) == calendar_uid]
+        cal = _get_calendar(apple_id, app_password, calendar_uid)
+        calendars = [cal] if cal is not None else []
+    else:
+        calendars = _get_calendars(apple_id, app_password)
 
-    results: list[dict] = []
-    for cal in calendars:
+    lo, hi = _day_floor(start), _day_ceil(end)
+    futures = [_EXECUTOR.submit(_cached_events, cal, lo, hi) for cal in calendars]
+
+    span_lists: list[list[_Span]] = []
+    for fut in futures:
         try:
-            events = cal.search(start=start, end=end, event=True, expand=True)
-            for ev in events:
-                cal_data = iCalendar.from_ical(ev.data)
-                for component in cal_data.walk():
-                    if component.name == "VEVENT":
-                        d = _fmt_event(component)
-                        d["calendar"] = cal.name or ""
-                        results.append(d)
+            span_lists.append(fut.result())
         except Exception:  # noqa: BLE001
             continue
 
-    return results
+    return _iter_events(span_lists, start, end)
+
+
+def _iter_events(
+    span_lists: list[list[_Span]], start: datetime, end: datetime
+) -> Iterator[dict]:
+    """Yield each calendar's events overlapping [start, end), sorted by start."""
+    for spans in span_lists:
+        # Windows may overlap at the edges; keep each instance once.
+        seen: set[tuple[str, datetime]] = set()
+        hits: list[tuple[datetime, dict]] = []
+        for ev_start, ev_end, d in spans:
+            key = (d["uid"], ev_start)
+            if key not in seen and _overlaps(ev_start, ev_end, start, end):
+                seen.add(key)
+                hits.append((ev_start, d))
+        hits.sort(key=lambda h: h[0])
+        for _, d in hits:
+            yield d
+
+
+def _find_event(
+    cal: caldav.Calendar,
+    event_uid: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> dict | None:
+    """Scan *cal* (optionally only [start, end)) for the VEVENT with *event_uid*."""
+    for ev in cal.search(start=start, end=end, event=True):
+        for component in _vevents(ev):
+            if str(component.get("uid", "")) == event_uid:
+                d = _fmt_event(component)
+                d["calendar"] = cal.name or ""
+                return d
+    return None
 
 
-def get_event(
-    apple_id: str,
-    app_password: str,
+def _lookup_uid(cal: caldav.Calendar, event_uid: str) -> dict | None:
+    """Ask the server for the VEVENT with *event_uid* via a UID calendar-query."""
+    try:
+        ev = cal.object_by_uid(event_uid, comp_class=caldav.Event)
+    except NotFoundError:
+        return None
+    for component in _vevents(ev):
+        if str(component.get("uid", "")) == event_uid:
+            d = _fmt_event(component)
+            d["calendar"] = cal.name or ""
+            return d
+    return None
+
+
+def _scan_calendars(
+    calendars: list[caldav.Calendar],
+    find: Callable[..., dict | None],
     event_uid: str,
+    failed: list[caldav.Calendar] | None = None,
 ) -> dict | None:
-    """Return a single event by UID, or None if not found."""
-    client = _client(apple_id, app_password)
-    principal = client.principal()
+    """Run *find* on all *calendars* in parallel, returning the first match.
 
-    for cal in principal.calendars():
-        try:
-            events = cal.search(event=True)
-            for ev in events:
-                cal_data = iCalendar.from_ical(ev.data)
-                for component in cal_data.walk():
-                    if component.name == "VEVENT":
-                        uid = str(component.get("uid", ""))
-                        if uid == event_uid:
-                            d = _fmt_event(component)
-                            d["calendar"] = cal.name or ""
-                            return d
-        except Exception:  # noqa: BLE001
-            continue
+    Calendars whose search hit a server error are appended to *failed* when
+    given; auth and connection failures are re-raised.
+    """
+    futures = {_EXECUTOR.submit(find, cal, event_uid): cal for cal in calendars}
+    try:
+        for fut in as_completed(futures):
+            try:
+                d = fut.result()
+            except _FATAL:
+                raise
+            except Exception:  # noqa: BLE001
+                if failed is not None:
+                    failed.append(futures[fut])
+                continue
+            if d is not None:
+                return d
+    finally:
+        # Skip the calendars that have not started searching yet.
+        for fut in futures:
+            fut.cancel()
 
     return None
 
 
+@_retry_on_auth
+def get_event(
+    apple_id: str,
+    app_password: str,
+    event_uid: str,
+) -> dict | None:
+    """Return a single event by UID, or None if not found."""
+    calendars = _get_calendars(apple_id, app_password)
+
+    # Seen recently: ask only its calendar, around its start.
+    hit = _UID_INDEX.get(event_uid)
+    if hit is not None and time.monotonic() - hit[2] < UID_TTL:
+        cal_id, ev_start, _ = hit
+        cal = _get_calendar(apple_id, app_password, cal_id)
+        if cal is not None:
+            try:
+                d = _find_event(
+                    cal, event_uid, ev_start - timedelta(days=1), ev_start + timedelta(days=1)
+                )
+            except _FATAL:
+                raise
+            except Exception:  # noqa: BLE001
+                d = None
+            if d is not None:
+                return d
+
+    # The server matches the UID itself, so each calendar costs one small
+    # REPORT whatever the event's date. Only calendars that reject the
+    # query are read in full.
+    failed: list[caldav.Calendar] = []
+    d = _scan_calendars(calendars, _lookup_uid, event_uid, failed)
+    if d is not None or not failed:
+        return d
+    return _scan_calendars(failed, _find_event, event_uid)
+
+
+@_retry_on_auth
 def create_event(
     apple_id: str,
     app_password: str,
@@ -162,16 +489,12 @@ def create_event(
     start_dt = dateparser.parse(start)
     end_dt = dateparser.parse(end)
 
-    client = _client(apple_id, app_password)
-    principal = client.principal()
-    calendars = principal.calendars()
-
     if calendar_uid:
-        cal = next((c for c in calendars if str(c.id) == calendar_uid), None)
+        cal = _get_calendar(apple_id, app_password, calendar_uid)
         if cal is None:
             raise ValueError(f"Calendar '{calendar_uid}' not found.")
     else:
-        cal = calendars[0]
+        cal = _get_calendars(apple_id, app_password)[0]
 
     # Build iCal payload
     event_uid = str(uuid.uuid4())
@@ -192,6 +515,9 @@ def create_event(
 
     ical.add_component(ev)
     cal.add_event(ical.to_ical().decode())
+    _invalidate_events(cal)
+    with _EVENT_LOCK:
+        _UID_INDEX[event_uid] = (str(cal.id), _utc(start_dt), time.monotonic())
 
     return {
         "uid": event_uid,
@@ -202,3 +528,57 @@ def create_event(
         "description": description,
         "calendar": cal.name or "",
     }
+
+
+def cached(tool: str, apple_id: str, arguments: dict[str, Any]) -> bool:
+    """Whether *tool* would be answered from this module's caches alone.
+
+    The server uses this to leave such calls out of rate limiting, since
+    they never reach iCloud.
+    """
+    entry = _CALS_CACHE.get(apple_id)
+    if (
+        apple_id not in _PRINCIPAL_CACHE
+        or entry is None
+        or time.monotonic() - entry[2] >= CAL_TTL
+    ):
+        return False
+    if tool == "calendar_list_calendars":
+        return True
+    if tool != "calendar_list_events":
+        return False
+
+    try:
+        start, end = _event_range(arguments.get("from_date"), arguments.get("to_date"))
+    except (ValueError, OverflowError):
+        return False  # let the real call report the bad date
+    calendar_uid = arguments.get("calendar_uid")
+    if calendar_uid:
+        cal = entry[1].get(calendar_uid)
+        calendars = [cal] if cal is not None else []
+    else:
+        calendars = entry[0]
+
+    lo, hi = _day_floor(start), _day_ceil(end)
+    now = time.monotonic()
+    with _EVENT_LOCK:
+        fresh = [k for k, (_, ts) in _EVENT_CACHE.items() if now - ts < EVENT_TTL]
+    for cal in calendars:
+        cal_id = str(cal.id)
+        windows = sorted((k[1], k[2], None) for k in fresh if k[0] == cal_id)
+        if _gaps(windows, lo, hi):
+            return False
+    return True
+
+
+@_retry_on_auth
+def warm(apple_id: str, app_password: str) -> None:
+    """Refresh principal and calendar discovery ahead of its CAL_TTL expiry.
+
+    Called periodically by the server so interactive calls find the
+    calendar list populated instead of waiting on iCloud. Events are not
+    prefetched: their cache expires after EVENT_TTL, long before the next
+    refresh would come round.
+    """
+    _CALS_CACHE.pop(apple_id, None)
+    _get_calendars(apple_id, app_password)
@@ -7,24 +7,135 @@ No pyicloud dependency — uses Python built-ins only.
 
 from __future__ import annotations
 
+import atexit
+import binascii
 import email
-import imaplib
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formatdate, make_msgid
+import functools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from email.utils import getaddresses
+from typing import TYPE_CHECKING, Any, Iterator
+
+from tools._imap_parse import parse_fetch
+from tools._imap_pool import ImapPool, PipelinedIMAP
+from tools._tls import SSL_CONTEXT
+
+if TYPE_CHECKING:
+    import smtplib
 
 IMAP_HOST = "imap.mail.me.com"
 IMAP_PORT = 993
 SMTP_HOST = "smtp.mail.me.com"
 SMTP_PORT = 587
 
+_POOL = ImapPool(IMAP_HOST, IMAP_PORT)
+
+# Multi-mailbox listings run one mailbox per worker, each on its own pooled
+# connection; stay within the pool's idle cap so every one can be parked.
+LIST_WORKERS = 3
+_EXECUTOR = ThreadPoolExecutor(max_workers=LIST_WORKERS, thread_name_prefix="imap")
+
+# Folders are created or renamed rarely; re-LIST at most every 5 minutes.
+MAILBOX_TTL = 300.0
+_MB_CACHE: dict[str, tuple[list[dict], float]] = {}
+
+
+# One parked SMTP session per account (apple_id → (password, session)).
+# STARTTLS + AUTH costs several round-trips; a NOOP proves reuse is safe.
+_SMTP_POOL: dict[str, tuple[str, smtplib.SMTP]] = {}
+_SMTP_LOCK = threading.Lock()
+# A parked session may have gone half-open; bound each socket operation so
+# its NOOP check fails instead of blocking forever.
+SMTP_TIMEOUT = 30
+
+
+def _imap(
+    apple_id: str, app_password: str
+) -> AbstractContextManager[PipelinedIMAP]:
+    """Return a pooled, authenticated IMAP connection as a context manager."""
+    return _POOL.connection(apple_id, app_password)
+
+
+@contextmanager
+def _smtp(apple_id: str, app_password: str) -> Iterator[smtplib.SMTP]:
+    """Yield an authenticated SMTP session, parking it again afterwards."""
+    # Imported here so that read-only mail tools never load the SMTP stack.
+    import smtplib
+
+    with _SMTP_LOCK:
+        entry = _SMTP_POOL.pop(apple_id, None)
+
+    smtp = None
+    if entry is not None:
+        password, parked = entry
+        try:
+            if password == app_password and parked.noop()[0] == 250:
+                smtp = parked
+        except (smtplib.SMTPException, OSError):
+            pass
+        if smtp is None:
+            _smtp_quit(parked)
+
+    if smtp is None:
+        smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        try:
+            smtp.ehlo()
+            smtp.starttls(context=SSL_CONTEXT)
+            smtp.login(apple_id, app_password)
+        except BaseException:
+            smtp.close()
+            raise
+
+    try:
+        yield smtp
+    except smtplib.SMTPServerDisconnected:
+        smtp.close()
+        raise
+    except smtplib.SMTPException:
+        # A refused recipient or rejected DATA leaves the session usable
+        # (SMTPException subclasses OSError, so this must come first).
+        try:
+            smtp.rset()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+        else:
+            _smtp_park(apple_id, app_password, smtp)
+        raise
+    except OSError:  # socket error or timeout: the session is dead
+        smtp.close()
+        raise
+    except BaseException:
+        _smtp_park(apple_id, app_password, smtp)
+        raise
+    else:
+        _smtp_park(apple_id, app_password, smtp)
+
+
+def _smtp_park(apple_id: str, app_password: str, smtp: smtplib.SMTP) -> None:
+    with _SMTP_LOCK:
+        if apple_id not in _SMTP_POOL:
+            _SMTP_POOL[apple_id] = (app_password, smtp)
+            return
+    _smtp_quit(smtp)
+
+
+def _smtp_quit(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:  # noqa: BLE001
+        smtp.close()
+
 
-def _imap(apple_id: str, app_password: str) -> imaplib.IMAP4_SSL:
-    """Return an authenticated IMAP connection."""
-    conn = imaplib.IMAP4_SSL(IMAP_HOST, IMAP_PORT)
-    conn.login(apple_id, app_password)
-    return conn
+@atexit.register
+def _smtp_quit_all() -> None:
+    with _SMTP_LOCK:
+        sessions = [smtp for _, smtp in _SMTP_POOL.values()]
+        _SMTP_POOL.clear()
+    for smtp in sessions:
+        _smtp_quit(smtp)
 
 
 def _decode_header(value: str | bytes | None) -> str:
@@ -33,7 +144,81 @@ def _decode_header(value: str | bytes | None) -> str:
         return ""
     if isinstance(value, bytes):
         value = value.decode("utf-8", errors="replace")
-    parts = email.header.decode_header(value)
+    if isinstance(value, str):
+        return _decode_words(value)
+    # email.header.Header (undecodable raw bytes); rare, so not cached.
+    return _join_parts(email.header.decode_header(value))
+
+
+# LIST reply: (\Flags) "delimiter"|NIL "name"|name
+_LIST_RE = re.compile(
+    rb'\([^)]*\)\s+(?:"(?:[^"\\]|\\.)*"|NIL)\s+(?:"((?:[^"\\]|\\.)*)"|(\S+))\s*$'
+)
+_UNQUOTE_RE = re.compile(rb"\\(.)")
+
+# RFC 2047 encoded word: =?charset?Q|B?payload?=
+_ENCODED_WORD_RE = re.compile(r"=\?([^?\s]+)\?([QqBb])\?([^?\s]*)\?=")
+
+
+# Sender names, addresses and thread subjects repeat heavily across a
+# listing; decode each distinct raw value once.
+@functools.lru_cache(maxsize=4096)
+def _decode_words(value: str) -> str:
+    """Decode the RFC 2047 encoded words in *value*.
+
+    Plain values are returned untouched. Adjacent words in one charset are
+    joined before decoding, so a character split across two words still
+    comes out whole, and the whitespace between adjacent encoded words is
+    dropped as RFC 2047 section 6.2 requires.
+    """
+    if "=?" not in value:
+        return value
+
+    out: list[str] = []
+    pending = b""
+    pending_charset = ""
+    pos = 0
+    for m in _ENCODED_WORD_RE.finditer(value):
+        charset, encoding, payload = m.groups()
+        try:
+            raw = _decode_payload(encoding, payload)
+        except (binascii.Error, UnicodeEncodeError):
+            continue  # malformed word: leave it in the text as-is
+
+        gap = value[pos:m.start()]
+        if not (pos and gap.isspace()) or charset != pending_charset:
+            if pending:
+                out.append(_to_text(pending, pending_charset))
+                pending = b""
+            if not (pos and gap.isspace()):
+                out.append(gap)
+        pending += raw
+        pending_charset = charset
+        pos = m.end()
+
+    if pending:
+        out.append(_to_text(pending, pending_charset))
+    out.append(value[pos:])
+    return "".join(out)
+
+
+def _decode_payload(encoding: str, payload: str) -> bytes:
+    data = payload.encode("ascii")
+    if encoding in "Bb":
+        return binascii.a2b_base64(data + b"=" * (-len(data) % 4))
+    return binascii.a2b_qp(data, header=True)
+
+
+def _to_text(raw: bytes, charset: str) -> str:
+    # Drop any RFC 2231 language suffix (utf-8*en).
+    charset = charset.partition("*")[0]
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _join_parts(parts: list[tuple[bytes | str, str | None]]) -> str:
     decoded = []
     for part, charset in parts:
         if isinstance(part, bytes):
@@ -43,36 +228,140 @@ def _decode_header(value: str | bytes | None) -> str:
     return "".join(decoded)
 
 
+# Lower-cased header name -> result key, in output order.
+_MSG_FIELDS = {
+    "subject": "subject",
+    "from": "from",
+    "to": "to",
+    "date": "date",
+    "message-id": "message_id",
+}
+
+
+# Address headers are rebuilt from (name, address) pairs so that
+# list_messages (ENVELOPE) and get_message (raw headers) agree on format.
+_ADDRESS_FIELDS = frozenset({"from", "to"})
+# RFC 5322 specials that force a display name to be quoted (as formataddr).
+_SPECIALS_RE = re.compile(r'[][\\()<>@,:;".]')
+
+
 def _fmt_message(uid: str, msg: email.message.Message) -> dict:
+    # Message.get() rescans every header per lookup; walk them once instead,
+    # keeping the first occurrence of each name as get() does.
+    found: dict[str, str] = {}
+    for name, value in msg.items():
+        key = _MSG_FIELDS.get(name.lower())
+        if key is not None and key not in found:
+            found[key] = value
+
+    result = {"uid": uid}
+    for key in _MSG_FIELDS.values():
+        value = found.get(key)
+        if key in _ADDRESS_FIELDS and value is not None:
+            pairs = [
+                (_decode_header(name), addr)
+                for name, addr in getaddresses([str(value)])
+                if addr
+            ]
+            if pairs:
+                result[key] = _join_addresses(pairs)
+                continue
+        result[key] = _decode_header(value)
+    return result
+
+
+def _join_addresses(pairs: list[tuple[str, str]]) -> str:
+    """Render (display name, address) pairs as 'Name <a@b>, ...'.
+
+    Mirrors email.utils.formataddr, minus its RFC 2047 re-encoding of
+    non-ASCII names: callers want the decoded text.
+    """
+    out = []
+    for name, addr in pairs:
+        if not name:
+            out.append(addr)
+            continue
+        if _SPECIALS_RE.search(name):
+            name = '"{}"'.format(name.replace("\\", "\\\\").replace('"', '\\"'))
+        out.append(f"{name} <{addr}>")
+    return ", ".join(out)
+
+
+def _fmt_addresses(addrs: list | None) -> str:
+    """Render an ENVELOPE address list as 'Name <mailbox@host>, ...'."""
+    pairs = []
+    for addr in addrs or []:
+        # (name adl mailbox host); host is NIL on group start/end markers.
+        if not isinstance(addr, list) or len(addr) < 4 or addr[3] is None:
+            continue
+        spec = f"{_decode_header(addr[2])}@{_decode_header(addr[3])}"
+        pairs.append((_decode_header(addr[0]), spec))
+    return _join_addresses(pairs)
+
+
+def _parse_envelope(uid: str, env: list) -> dict:
+    """Build the list_messages record from a FETCH ENVELOPE structure."""
+    # RFC 3501 order: date subject from sender reply-to to cc bcc
+    # in-reply-to message-id.
+    date, subject, from_, _, _, to, *_, message_id = env[:10]
     return {
         "uid": uid,
-        "subject": _decode_header(msg.get("Subject")),
-        "from": _decode_header(msg.get("From")),
-        "to": _decode_header(msg.get("To")),
-        "date": _decode_header(msg.get("Date")),
-        "message_id": _decode_header(msg.get("Message-ID")),
+        "subject": _decode_header(subject),
+        "from": _fmt_addresses(from_),
+        "to": _fmt_addresses(to),
+        "date": _decode_header(date),
+        "message_id": _decode_header(message_id),
     }
 
 
+def cached(tool: str, apple_id: str, arguments: dict[str, Any]) -> bool:
+    """Whether *tool* would be answered from this module's caches alone.
+
+    The server uses this to leave such calls out of rate limiting, since
+    they never reach iCloud.
+    """
+    if tool != "mail_list_mailboxes":
+        return False
+    entry = _MB_CACHE.get(apple_id)
+    return entry is not None and time.monotonic() - entry[1] < MAILBOX_TTL
+
+
 def list_mailboxes(apple_id: str, app_password: str) -> list[dict]:
     """Return all mailboxes / folders with unread counts."""
-    conn = _imap(apple_id, app_password)
-    _, raw_list = conn.list()
-    conn.logout()
+    entry = _MB_CACHE.get(apple_id)
+    if entry is not None and time.monotonic() - entry[1] < MAILBOX_TTL:
+        return entry[0]
+
+    with _imap(apple_id, app_password) as conn:
+        _, raw_list = conn.list()
 
     mailboxes: list[dict] = []
     for item in raw_list or []:
-        if not item:
-            continue
-        decoded = item.decode() if isinstance(item, bytes) else item
-        # Format: (\Flags) "delimiter" "name"
-        parts = decoded.rsplit(" ", 1)
-        name = parts[-1].strip().strip('"')
-        mailboxes.append({"name": name})
-
+        if isinstance(item, tuple):
+            # Name sent as a literal: (b'(\\Flags) "/" {n}', b'name')
+            name = item[1]
+        else:
+            m = _LIST_RE.match(item) if item else None
+            if m is None:
+                continue
+            quoted, atom = m.groups()
+            name = _UNQUOTE_RE.sub(rb"\1", quoted) if quoted is not None else atom
+        mailboxes.append({"name": name.decode("utf-8", errors="replace")})
+
+    _MB_CACHE[apple_id] = (mailboxes, time.monotonic())
     return mailboxes
 
 
+def warm(apple_id: str, app_password: str) -> None:
+    """Re-list mailboxes ahead of expiry.
+
+    Going through the pool also keeps the parked IMAP connection from
+    idling out, so the next interactive call skips TLS + LOGIN.
+    """
+    _MB_CACHE.pop(apple_id, None)
+    list_mailboxes(apple_id, app_password)
+
+
 def list_messages(
     apple_id: str,
     app_password: str,
@@ -91,26 +380,167 @@ def list_messages(
         unread_only: If True, return only unread messages.
     """
     limit = min(limit, 100)
-    conn = _imap(apple_id, app_password)
+    results: list[dict] = []
 
-    conn.select(f'"{mailbox}"', readonly=True)
-    criteria = "UNSEEN" if unread_only else "ALL"
-    _, data = conn.search(None, criteria)
+    with _imap(apple_id, app_password) as conn:
+        # unread_only is resolved by the server's SEARCH, so read messages
+        # are never fetched or formatted here. UIDs, unlike sequence
+        # numbers, stay valid if another client expunges in between.
+        criteria = "UNSEEN" if unread_only else "ALL"
+        if conn.has_capability("SORT"):
+            # RFC 5256: the server hands back the newest-first order.
+            _, data = conn.examine_and(
+                f'"{mailbox}"', "UID", "SORT", "(REVERSE DATE)", "UTF-8", criteria
+            )
+            uids = data[0].split()[:limit] if data and data[0] else []
+        else:
+            _, data = conn.examine_and(f'"{mailbox}"', "UID", "SEARCH", criteria)
+            # UIDs ascend in arrival order; most recent first.
+            uids = data[0].split()[-limit:][::-1] if data and data[0] else []
+        if not uids:
+            return results
+
+        # One FETCH for the whole set instead of a round-trip per message.
+        # ENVELOPE carries the listed fields already split out by the
+        # server, so no header block is transferred or MIME-parsed.
+        _, msg_data = conn.uid("FETCH", b",".join(uids).decode(), "(UID ENVELOPE)")
+
+    envelopes = {
+        items[b"UID"]: items[b"ENVELOPE"]
+        for _, items in parse_fetch(msg_data)
+        if b"UID" in items and isinstance(items.get(b"ENVELOPE"), list)
+    }
+    for uid in uids:
+        env = envelopes.get(uid)
+        if env is not None:
+            results.append(_parse_envelope(uid.decode(), env))
 
-    uids = data[0].split() if data[0] else []
-    # Most recent first
-    uids = uids[-limit:][::-1]
+    return results
 
-    results: list[dict] = []
-    for uid in uids:
-        _, msg_data = conn.fetch(uid, "(RFC822.HEADER)")
-        if not msg_data or not msg_data[0]:
-            continue
-        raw = msg_data[0][1] if isinstance(msg_data[0], tuple) else msg_data[0]
-        msg = email.message_from_bytes(raw)
-        results.append(_fmt_message(uid.decode(), msg))
 
-    conn.logout()
+def _fetched(data: list) -> dict[bytes, Any]:
+    """Merge the FETCH items returned for a single message."""
+    merged: dict[bytes, Any] = {}
+    for _, items in parse_fetch(data):
+        merged.update(items)
+    return merged
+
+
+def _find_text_part(structure: list, spec: str = "") -> tuple[str, str, str] | None:
+    """Locate the first inline text/plain part in a BODYSTRUCTURE.
+
+    Returns its section spec (e.g. "1.2"), transfer encoding and charset.
+    """
+    if structure and isinstance(structure[0], list):  # multipart: children first
+        for i, child in enumerate(structure, 1):
+            if not isinstance(child, list):
+                break
+            found = _find_text_part(child, f"{spec}.{i}" if spec else str(i))
+            if found is not None:
+                return found
+        return None
+
+    if len(structure) < 7 or not isinstance(structure[0], bytes):
+        return None
+    if (structure[0].lower(), (structure[1] or b"").lower()) != (b"text", b"plain"):
+        return None
+    # text parts: ... size lines md5 disposition
+    disposition = structure[9] if len(structure) > 9 else None
+    if isinstance(disposition, list) and (disposition[0] or b"").lower() == b"attachment":
+        return None
+    return (spec or "1", *_part_coding(structure))
+
+
+def _part_coding(structure: list) -> tuple[str, str]:
+    """Return (transfer encoding, charset) of a single-part BODYSTRUCTURE."""
+    params = structure[2] if isinstance(structure[2], list) else []
+    charset = b""
+    for key, value in zip(params[::2], params[1::2]):
+        if isinstance(key, bytes) and key.lower() == b"charset" and isinstance(value, bytes):
+            charset = value
+            break
+    encoding = structure[5] if isinstance(structure[5], bytes) else b"7bit"
+    return encoding.decode("ascii", "replace").lower(), charset.decode("ascii", "replace")
+
+
+def _decode_part(raw: bytes, encoding: str, charset: str) -> str:
+    """Undo *raw*'s transfer encoding and decode it as *charset* text."""
+    payload: bytes | None
+    if encoding in ("7bit", "8bit", "binary"):
+        payload = raw
+    elif encoding == "quoted-printable":
+        payload = binascii.a2b_qp(raw)
+    elif encoding == "base64":
+        try:
+            payload = binascii.a2b_base64(raw)
+        except binascii.Error:
+            payload = None
+    else:
+        payload = None
+
+    if payload is None:
+        # Unusual or damaged encodings (uuencode, bad base64 padding): let
+        # the email package apply its lenient decoders.
+        from email.message import Message
+
+        part = Message()
+        part["Content-Transfer-Encoding"] = encoding
+        part.set_payload(raw)
+        payload = part.get_payload(decode=True) or b""
+
+    try:
+        return payload.decode(charset or "utf-8", errors="replace")
+    except LookupError:  # unknown charset label
+        return payload.decode("utf-8", errors="replace")
+
+
+def _legacy_body(msg: email.message.Message) -> str:
+    """Find the text/plain body by walking a fully downloaded message."""
+    if msg.is_multipart():
+        for part in msg.walk():
+            ct = part.get_content_type()
+            cd = str(part.get("Content-Disposition", ""))
+            if ct == "text/plain" and "attachment" not in cd:
+                return part.get_payload(decode=True).decode(
+                    part.get_content_charset() or "utf-8", errors="replace"
+                )
+        return ""
+    payload = msg.get_payload(decode=True)
+    if payload:
+        return payload.decode(msg.get_content_charset() or "utf-8", errors="replace")
+    return ""
+
+
+def list_messages_many(
+    apple_id: str,
+    app_password: str,
+    mailboxes: list[str],
+    limit: int = 20,
+    unread_only: bool = False,
+) -> list[dict]:
+    """
+    Return messages from several mailboxes, listing them in parallel.
+
+    Each record gains a "mailbox" key; mailboxes keep the order given.
+
+    Args:
+        apple_id: iCloud Apple ID.
+        app_password: App-specific password.
+        mailboxes: Mailbox names.
+        limit: Maximum number of messages per mailbox (default 20, max 100).
+        unread_only: If True, return only unread messages.
+    """
+    mailboxes = list(dict.fromkeys(mailboxes))
+    futures = [
+        _EXECUTOR.submit(list_messages, apple_id, app_password, mailbox, limit, unread_only)
+        for mailbox in mailboxes
+    ]
+
+    results: list[dict] = []
+    for mailbox, fut in zip(mailboxes, futures):
+        for record in fut.result():
+            record["mailbox"] = mailbox
+            results.append(record)
     return results
 
 
@@ -123,42 +553,56 @@ def get_message(
     """
     Return the full content of a message.
 
+    Only the header block and the text/plain part are downloaded; the
+    message's BODYSTRUCTURE says where that part lives, so attachments
+    never cross the wire.
+
     Args:
         apple_id: iCloud Apple ID.
         app_password: App-specific password.
-        uid: Message UID (sequence number from list_messages).
+        uid: Message UID (as returned by list_messages).
         mailbox: Mailbox containing the message (default: INBOX).
     """
-    conn = _imap(apple_id, app_password)
-    conn.select(f'"{mailbox}"', readonly=True)
-    _, msg_data = conn.fetch(uid, "(RFC822)")
-    conn.logout()
-
-    if not msg_data or not msg_data[0]:
-        return None
-
-    raw = msg_data[0][1] if isinstance(msg_data[0], tuple) else msg_data[0]
-    msg = email.message_from_bytes(raw)
-    result = _fmt_message(uid, msg)
-
-    # Extract body
     body = ""
-    if msg.is_multipart():
-        for part in msg.walk():
-            ct = part.get_content_type()
-            cd = str(part.get("Content-Disposition", ""))
-            if ct == "text/plain" and "attachment" not in cd:
-                body = part.get_payload(decode=True).decode(
-                    part.get_content_charset() or "utf-8", errors="replace"
-                )
-                break
-    else:
-        payload = msg.get_payload(decode=True)
-        if payload:
-            body = payload.decode(
-                msg.get_content_charset() or "utf-8", errors="replace"
-            )
-
+    with _imap(apple_id, app_password) as conn:
+        _, data = conn.examine_and(
+            f'"{mailbox}"', "UID", "FETCH", uid, "(BODYSTRUCTURE BODY.PEEK[HEADER])"
+        )
+        items = _fetched(data)
+        if not items:
+            return None
+
+        header = items.get(b"BODY[HEADER]")
+        structure = items.get(b"BODYSTRUCTURE")
+        if (
+            not isinstance(header, bytes)
+            or not isinstance(structure, list)
+            or (not isinstance(structure[0], list) and len(structure) < 7)
+        ):
+            # Unexpected reply shape: download the whole message instead.
+            _, msg_data = conn.uid("FETCH", uid, "(BODY.PEEK[])")
+            if not msg_data or not isinstance(msg_data[0], tuple):
+                return None
+            msg = email.message_from_bytes(msg_data[0][1])
+            result = _fmt_message(uid, msg)
+            result["body"] = _legacy_body(msg)
+            return result
+
+        # BODYSTRUCTURE already carries the part's transfer encoding and
+        # charset, so only the raw section is fetched and no MIME parser
+        # runs over it.
+        if not isinstance(structure[0], list):
+            found = ("TEXT", *_part_coding(structure))
+        else:
+            found = _find_text_part(structure)
+        if found is not None:
+            section, encoding, charset = found
+            _, data = conn.uid("FETCH", uid, f"(BODY.PEEK[{section}])")
+            text = _fetched(data).get(f"BODY[{section}]".encode())
+            if isinstance(text, bytes):
+                body = _decode_part(text, encoding, charset)
+
+    result = _fmt_message(uid, email.message_from_bytes(header))
     result["body"] = body
     return result
 
@@ -187,7 +631,10 @@ def send_message(
     Returns:
         dict with 'status' and 'message_id'.
     """
-    msg = MIMEMultipart()
+    from email.message import EmailMessage
+    from email.utils import formatdate, make_msgid
+
+    msg = EmailMessage()
     msg["From"] = apple_id
     msg["To"] = to
     msg["Subject"] = subject
@@ -200,18 +647,12 @@ def send_message(
     if bcc:
         msg["Bcc"] = bcc
 
-    msg.attach(MIMEText(body, "plain", "utf-8"))
-
-    recipients = [r.strip() for r in to.split(",")]
-    if cc:
-        recipients += [r.strip() for r in cc.split(",")]
-    if bcc:
-        recipients += [r.strip() for r in bcc.split(",")]
+    # Quoted-printable keeps the body 7-bit clean without needing 8BITMIME.
+    msg.set_content(body, charset="utf-8", cte="quoted-printable")
 
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as smtp:
-        smtp.ehlo()
-        smtp.starttls()
-        smtp.login(apple_id, app_password)
-        smtp.sendmail(apple_id, recipients, msg.as_bytes())
+    # send_message() takes the envelope recipients from To/Cc/Bcc and
+    # leaves the Bcc header out of the transmitted message.
+    with _smtp(apple_id, app_password) as smtp:
+        smtp.send_message(msg)
 
     return {"status": "sent", "message_id": msg_id}
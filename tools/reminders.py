@@ -11,28 +11,90 @@ import threading
 from datetime import datetime, timezone
 from typing import Any
 
-from dateutil import parser as dateparser
-
-# EventKit constants
-EK_ENTITY_TYPE_REMINDER = 1  # EKEntityTypeReminder
+# Imported once here rather than inside every tool. Off macOS (or without
+# PyObjC) the module still imports; the first Reminders call reports why.
+try:
+    from EventKit import (  # type: ignore[import]
+        EKEntityTypeReminder,
+        EKEventStore,
+        EKReminder,
+    )
+    from Foundation import NSCalendar, NSDate  # type: ignore[import]
+except ImportError as exc:
+    _EVENTKIT_IMPORT_ERROR: ImportError | None = exc
+else:
+    _EVENTKIT_IMPORT_ERROR = None
+
+# Calendar units copied into a reminder's due date components.
+_NSCAL_UNITS = (
+    1 << 2  # NSCalendarUnitYear
+    | 1 << 4  # NSCalendarUnitMonth
+    | 1 << 5  # NSCalendarUnitDay
+    | 1 << 6  # NSCalendarUnitHour
+    | 1 << 7  # NSCalendarUnitMinute
+)
+
+# One authorised store per process: creating it and asking for access
+# costs a round-trip to the Reminders daemon on every call otherwise.
+_STORE: Any | None = None
+_STORE_LOCK = threading.Lock()
 
 
 def _get_store() -> Any:
-    """Return an authorised EKEventStore, requesting access if needed."""
-    from EventKit import EKEventStore  # type: ignore[import]
+    """Return the shared, authorised EKEventStore, creating it on first use."""
+    global _STORE
+    if _STORE is not None:
+        return _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = _open_store()
+        return _STORE
 
-    store = EKEventStore.alloc().init()
-    granted_event = threading.Event()
-    result_holder: list[bool] = []
 
-    def handler(granted: bool, error: Any) -> None:
-        result_holder.append(granted)
-        granted_event.set()
+def _reset_store() -> None:
+    """Drop the shared store so the next call opens a fresh one."""
+    global _STORE
+    with _STORE_LOCK:
+        _STORE = None
+
+
+class _Completion:
+    """Hand a completion handler's result back to the calling thread.
+
+    EventKit invokes completion handlers on its own dispatch queue, not on
+    the caller's run loop, so blocking on an Event wakes the caller the
+    moment the handler fires; polling the run loop would only add latency.
+    """
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._value: Any = None
+
+    def set(self, value: Any) -> None:
+        self._value = value
+        self._done.set()
 
-    store.requestAccessToEntityType_completion_(EK_ENTITY_TYPE_REMINDER, handler)
-    granted_event.wait(timeout=30)
+    def wait(self, timeout: float = 30.0) -> Any:
+        """Return the handler's value, or None if it didn't fire in time."""
+        self._done.wait(timeout)
+        return self._value
 
-    if not result_holder or not result_holder[0]:
+
+def _open_store() -> Any:
+    """Create an EKEventStore and request access to reminders."""
+    if _EVENTKIT_IMPORT_ERROR is not None:
+        raise ImportError(
+            "Reminders tools need macOS with pyobjc-framework-EventKit "
+            f"installed ({_EVENTKIT_IMPORT_ERROR})."
+        ) from _EVENTKIT_IMPORT_ERROR
+
+    store = EKEventStore.alloc().init()
+    access = _Completion()
+    store.requestAccessToEntityType_completion_(
+        EKEntityTypeReminder, lambda granted, error: access.set(granted)
+    )
+
+    if not access.wait():
         raise PermissionError(
             "Access to Reminders was denied. "
             "Grant access in System Settings → Privacy & Security → Reminders."
@@ -41,34 +103,47 @@ def _get_store() -> Any:
     return store
 
 
+def _parse_due(due: str) -> datetime:
+    """Parse an ISO-8601 due date, falling back to dateutil for anything else."""
+    try:
+        return datetime.fromisoformat(due)
+    except ValueError:
+        # Only loose, non-ISO input pays for importing dateutil.
+        from dateutil import parser as dateparser
+
+        return dateparser.parse(due)
+
+
 def _fmt_reminder(reminder: Any) -> dict:
+    # Every accessor is a bridged Objective-C message send; make each once.
     due = ""
-    if reminder.dueDateComponents():
-        nscal = reminder.dueDateComponents()
+    components = reminder.dueDateComponents()
+    if components:
         try:
-            year = nscal.year()
-            month = nscal.month()
-            day = nscal.day()
+            year = components.year()
+            month = components.month()
+            day = components.day()
             if year and month and day:
                 due = f"{year:04d}-{month:02d}-{day:02d}"
         except Exception:  # noqa: BLE001
             due = ""
 
+    title = reminder.title()
+    notes = reminder.notes()
+    list_title = reminder.calendar().title()
     return {
         "uid": str(reminder.calendarItemIdentifier()),
-        "title": str(reminder.title() or ""),
-        "description": str(reminder.notes() or ""),
+        "title": str(title or ""),
+        "description": str(notes or ""),
         "completed": bool(reminder.isCompleted()),
         "due": due,
         "priority": int(reminder.priority()),
-        "list": str(reminder.calendar().title() or ""),
+        "list": str(list_title or ""),
     }
 
 
 def list_lists() -> list[dict]:
     """Return all reminder lists."""
-    from EventKit import EKEntityTypeReminder  # type: ignore[import]
-
     store = _get_store()
     calendars = store.calendarsForEntityType_(EKEntityTypeReminder)
     return [
@@ -91,33 +166,27 @@ def list_reminders(
         list_uid: Restrict to a specific reminder list UID.
         include_completed: Include completed reminders (default: False).
     """
-    from EventKit import EKEntityTypeReminder  # type: ignore[import]
-
     store = _get_store()
     calendars = store.calendarsForEntityType_(EKEntityTypeReminder)
 
     if list_uid:
         calendars = [c for c in calendars if str(c.calendarIdentifier()) == list_uid]
 
-    predicate = store.predicateForRemindersInCalendars_(calendars)
-
-    result_holder: list[list] = []
-    done_event = threading.Event()
-
-    def completion(reminders: Any) -> None:
-        result_holder.append(list(reminders) if reminders else [])
-        done_event.set()
-
-    store.fetchRemindersMatchingPredicate_completion_(predicate, completion)
-    done_event.wait(timeout=30)
-
-    all_reminders = result_holder[0] if result_holder else []
-    results = [_fmt_reminder(r) for r in all_reminders]
-
-    if not include_completed:
-        results = [r for r in results if not r["completed"]]
+    if include_completed:
+        predicate = store.predicateForRemindersInCalendars_(calendars)
+    else:
+        # nil start/end matches every incomplete reminder, dated or not, so
+        # completed ones are never fetched or bridged into Python.
+        predicate = store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+            None, None, calendars
+        )
 
-    return results
+    fetched = _Completion()
+    store.fetchRemindersMatchingPredicate_completion_(
+        predicate, lambda reminders: fetched.set(reminders)
+    )
+    all_reminders = list(fetched.wait() or [])
+    return list(map(_fmt_reminder, all_reminders))
 
 
 def create_reminder(
@@ -140,9 +209,6 @@ def create_reminder(
     Returns:
         The created reminder as a dict.
     """
-    from EventKit import EKEntityTypeReminder, EKReminder  # type: ignore[import]
-    from Foundation import NSCalendar, NSDateComponents  # type: ignore[import]
-
     store = _get_store()
     calendars = store.calendarsForEntityType_(EKEntityTypeReminder)
 
@@ -164,25 +230,17 @@ def create_reminder(
         reminder.setNotes_(description)
 
     if due:
-        due_dt = dateparser.parse(due)
-        nscal = NSCalendar.currentCalendar()
-        units = (
-            1 << 2  # NSCalendarUnitYear
-            | 1 << 4  # NSCalendarUnitMonth
-            | 1 << 5  # NSCalendarUnitDay
-            | 1 << 6  # NSCalendarUnitHour
-            | 1 << 7  # NSCalendarUnitMinute
-        )
-        from Foundation import NSDate  # type: ignore[import]
-
+        due_dt = _parse_due(due)
         ns_date = NSDate.dateWithTimeIntervalSince1970_(due_dt.timestamp())
-        components = nscal.components_fromDate_(units, ns_date)
+        components = NSCalendar.currentCalendar().components_fromDate_(
+            _NSCAL_UNITS, ns_date
+        )
         reminder.setDueDateComponents_(components)
 
-    error_holder: list[Any] = []
-    success = store.saveReminder_commit_error_(reminder, True, None)
+    success, error = store.saveReminder_commit_error_(reminder, True, None)
     if not success:
-        raise RuntimeError("Failed to save reminder.")
+        _reset_store()
+        raise RuntimeError(f"Failed to save reminder: {error}")
 
     return _fmt_reminder(reminder)
 
@@ -198,11 +256,16 @@ def complete_reminder(uid: str) -> bool:
         True if found and marked complete, False if not found.
     """
     store = _get_store()
+    # EventKit looks the identifier up in its own store index, so there is
+    # no need to fetch and scan every list's reminders here.
     reminder = store.calendarItemWithIdentifier_(uid)
 
     if reminder is None:
         return False
 
     reminder.setCompleted_(True)
-    store.saveReminder_commit_error_(reminder, True, None)
+    success, error = store.saveReminder_commit_error_(reminder, True, None)
+    if not success:
+        _reset_store()
+        raise RuntimeError(f"Failed to save reminder: {error}")
     return True